@@ -0,0 +1,234 @@
+"""
+_aws.py - Shared AWS clients for the CourtVision scripts
+
+Builds one boto3 session and DynamoDB resource per process so every
+script reuses the same connection pool instead of re-loading botocore
+service models on each import.
+
+Also provides an opt-in on-disk TTL cache for read-only lookups that are
+repeated across script runs during development, and a parallel
+BatchWriteItem writer for bulk loads.
+
+Usage:
+    from _aws import get_table
+    table = get_table('courtvision-games')
+    
+    # From worker threads (boto3 resources are not thread-safe)
+    table = get_thread_table('courtvision-games')
+"""
+
+import time
+import json
+import hashlib
+import threading
+import boto3
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
+
+from _cache import cache_dir, prune, write_atomic
+
+REGION = 'us-east-1'
+
+# boto3 sessions are not thread-safe, so resources and clients are only
+# ever built under this lock; worker threads keep their own resource
+_build_lock = threading.Lock()
+_thread_local = threading.local()
+
+# Opt-in on-disk read cache, private to the current user
+CACHE_DIR = cache_dir('dynamodb')
+CACHE_TTL = 300
+_cache_enabled = False
+_serialize = TypeSerializer().serialize
+_deserialize = TypeDeserializer().deserialize
+
+# Pooled, keep-alive connections with adaptive retries for throttled writes
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+)
+
+
+@lru_cache(maxsize=None)
+def get_session() -> boto3.Session:
+    """Return the process-wide boto3 session"""
+    return boto3.Session(region_name=REGION)
+
+
+@lru_cache(maxsize=None)
+def get_resource():
+    """Return the shared DynamoDB service resource"""
+    with _build_lock:
+        return get_session().resource('dynamodb', config=CLIENT_CONFIG)
+
+
+@lru_cache(maxsize=None)
+def get_table(name: str):
+    """Return a cached DynamoDB Table handle"""
+    return get_resource().Table(name)
+
+
+@lru_cache(maxsize=None)
+def get_client():
+    """Return the shared low-level DynamoDB client (clients are thread-safe)"""
+    with _build_lock:
+        return get_session().client('dynamodb', config=CLIENT_CONFIG)
+
+
+def get_thread_table(name: str):
+    """
+    Return a Table handle owned by the calling thread.
+    
+    The main thread gets the shared get_table() handle; every other thread
+    lazily builds its own resource the first time it asks.
+    """
+    if threading.current_thread() is threading.main_thread():
+        return get_table(name)
+    
+    tables = getattr(_thread_local, 'tables', None)
+    if tables is None:
+        with _build_lock:
+            _thread_local.resource = get_session().resource('dynamodb', config=CLIENT_CONFIG)
+        tables = _thread_local.tables = {}
+    
+    if name not in tables:
+        tables[name] = _thread_local.resource.Table(name)
+    return tables[name]
+
+
+class ParallelBatchWriter:
+    """
+    Put-only counterpart of Table.batch_writer() for large loads.
+    
+    Items are serialized once with TypeSerializer and sent as 25-item
+    BatchWriteItem requests through the low-level client, several requests
+    in flight at a time. Unprocessed items are retried with backoff.
+    
+    With overwrite_by_pkeys, the last put of a key wins as with
+    batch_writer: a request holding a key that an earlier request already
+    carried waits for that request to finish before it is sent.
+    
+    Failures don't raise: once the context has exited, `errors` maps the
+    pk of every item in a failed request to its exception, so callers can
+    tell which partitions were not (fully) written.
+    """
+    
+    BATCH_SIZE = 25  # BatchWriteItem limit
+    
+    def __init__(self, table_name: str, max_workers: int = 4, overwrite_by_pkeys: list = None):
+        self.table_name = table_name
+        self.overwrite_by_pkeys = overwrite_by_pkeys
+        self.errors = {}
+        # Built here on the caller's thread; the client itself is thread-safe
+        self._client = get_client()
+        self._serialize = TypeSerializer().serialize
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = []
+        self._buffer = {}
+        self._sent = {}  # key -> future of the last request that carried it
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self._buffer:
+                self._flush()
+            for pks, future in self._futures:
+                error = future.exception()
+                if error is not None:
+                    for pk in pks:
+                        self.errors.setdefault(pk, error)
+        finally:
+            self._executor.shutdown(wait=True)
+    
+    def put_item(self, Item: dict):
+        # Like batch_writer, a later put of the same key replaces a buffered one
+        if self.overwrite_by_pkeys:
+            key = tuple(Item[k] for k in self.overwrite_by_pkeys)
+        else:
+            key = len(self._buffer)
+        
+        serialize = self._serialize
+        request = {'PutRequest': {'Item': {k: serialize(v) for k, v in Item.items()}}}
+        self._buffer[key] = (Item.get('pk'), request)
+        
+        if len(self._buffer) >= self.BATCH_SIZE:
+            self._flush()
+    
+    def _flush(self):
+        buffer = self._buffer
+        self._buffer = {}
+        pks = {pk for pk, _ in buffer.values()}
+        
+        after = {self._sent[key] for key in buffer if key in self._sent}
+        
+        # The pool runs requests in submission order, so anything waited on
+        # has already started and this can't deadlock
+        future = self._executor.submit(self._send, [request for _, request in buffer.values()], after)
+        self._futures.append((pks, future))
+        
+        if self.overwrite_by_pkeys:
+            for key in buffer:
+                self._sent[key] = future
+    
+    def _send(self, items: list, after: set = ()):
+        for earlier in after:
+            earlier.exception()  # wait; its own failure is reported separately
+        
+        request = {self.table_name: items}
+        delay = 0.1
+        
+        while request:
+            response = self._client.batch_write_item(RequestItems=request)
+            
+            # Retry throttled items with exponential backoff
+            request = response.get('UnprocessedItems') or None
+            if request:
+                time.sleep(delay)
+                delay = min(delay * 2, 5)
+
+
+def set_cache_enabled(enabled: bool):
+    """Turn the on-disk read cache on or off (e.g. for --cache)"""
+    global _cache_enabled
+    _cache_enabled = enabled
+    
+    # Entries are useless past their TTL, so clear those out first
+    if enabled:
+        prune(CACHE_DIR, CACHE_TTL)
+
+
+def disk_cache(ttl: int = CACHE_TTL):
+    """
+    Cache a function's result on disk for `ttl` seconds, keyed on its
+    positional arguments. Off unless set_cache_enabled(True) was called;
+    empty results are not cached.
+    
+    Entries are stored as DynamoDB JSON (TypeSerializer output), so
+    Decimals round-trip exactly and reading an entry never runs code.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args):
+            if not _cache_enabled:
+                return fn(*args)
+            
+            key = hashlib.sha256(repr((fn.__module__, fn.__qualname__, args)).encode()).hexdigest()
+            path = CACHE_DIR / f"{key}.json"
+            
+            try:
+                if time.time() - path.stat().st_mtime < ttl:
+                    return _deserialize(json.loads(path.read_text()))
+            except (OSError, ValueError, TypeError):
+                pass
+            
+            value = fn(*args)
+            if value:
+                write_atomic(path, [json.dumps(_serialize(value)).encode()])
+            
+            return value
+        return wrapper
+    return decorator
@@ -0,0 +1,59 @@
+"""
+_cache.py - Per-user on-disk cache helpers shared by _aws and _http
+
+Everything lives under $XDG_CACHE_HOME/courtvision (default
+~/.cache/courtvision), one subdirectory per cache, created private to the
+current user. Deleting that directory clears every cache.
+
+Usage:
+    from _cache import cache_dir, prune, write_atomic
+    directory = cache_dir('http')
+    write_atomic(directory / 'key.body', [b'...'])
+"""
+
+import os
+import time
+import threading
+from pathlib import Path
+
+CACHE_ROOT = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'courtvision'
+
+
+def cache_dir(name: str) -> Path:
+    """Return the cache subdirectory `name` (not created until written to)"""
+    return CACHE_ROOT / name
+
+
+def write_atomic(path: Path, chunks):
+    """
+    Write chunks to a private temp file, then rename over path, so
+    concurrent readers never see a half-written entry. Creates the
+    directory (mode 0700) if needed.
+    """
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, 'wb') as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp, path)
+
+
+def prune(directory: Path, max_age: float) -> int:
+    """Delete files in directory not modified for max_age seconds; returns the count"""
+    cutoff = time.time() - max_age
+    removed = 0
+    
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return 0
+    
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+                removed += 1
+        except FileNotFoundError:
+            pass  # removed by a concurrent prune
+    
+    return removed
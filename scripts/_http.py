@@ -0,0 +1,125 @@
+"""
+_http.py - Shared HTTP session for the ESPN fetchers
+
+One pooled requests.Session per process so repeated calls to
+site.api.espn.com reuse keep-alive connections instead of paying a
+TCP+TLS handshake per request. Transient errors and 429s are retried
+with backoff by the adapter.
+
+cached_get keeps response bodies on disk and revalidates them with
+ETag / Last-Modified, so reruns only transfer bodies that changed.
+RateLimiter spaces out requests made from several worker threads.
+
+Usage:
+    from _http import SESSION, cached_get
+    response = SESSION.get(url, timeout=30)
+    body_path = cached_get(url)
+"""
+
+import os
+import json
+import hashlib
+import time
+import threading
+import requests
+from functools import lru_cache
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from _cache import cache_dir, prune, write_atomic
+
+# Raw response bodies + their validators, next to the _aws read cache.
+# Entries unused for CACHE_MAX_AGE are pruned on the first cached_get.
+CACHE_DIR = cache_dir('http')
+CACHE_MAX_AGE = 30 * 24 * 3600
+VALIDATORS = (('ETag', 'If-None-Match'), ('Last-Modified', 'If-Modified-Since'))
+
+# The RateLimiter each thread last waited on, so its retries can wait too
+_thread_state = threading.local()
+
+
+class LimitedRetry(Retry):
+    """Retry policy whose retries also take a slot from the thread's RateLimiter"""
+    
+    def sleep(self, response=None):
+        super().sleep(response)
+        limiter = getattr(_thread_state, 'limiter', None)
+        if limiter is not None:
+            limiter.wait()
+
+
+RETRY = LimitedRetry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+)
+
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=RETRY))
+
+
+class RateLimiter:
+    """
+    Space out calls so at most one starts every `interval` seconds.
+    
+    Worker threads share one limiter: they overlap slow responses, but
+    their requests still start `interval` apart. A SESSION retry (429/5xx)
+    on a thread that waited here waits for a fresh slot too.
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+    
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self.interval
+        
+        _thread_state.limiter = self
+        if slot > now:
+            time.sleep(slot - now)
+
+
+@lru_cache(maxsize=None)
+def _prune_cache():
+    """Drop stale cache entries, once per process"""
+    prune(CACHE_DIR, CACHE_MAX_AGE)
+
+
+def cached_get(url: str, timeout: int = 30) -> Path:
+    """
+    GET url through an on-disk cache revalidated with ETag/Last-Modified.
+    
+    Returns the path of the cached body. A 304 reuses the stored copy
+    without transferring the body again.
+    """
+    _prune_cache()
+    key = hashlib.sha256(url.encode()).hexdigest()
+    body_path = CACHE_DIR / f"{key}.body"
+    meta_path = CACHE_DIR / f"{key}.meta"
+    
+    headers = {}
+    try:
+        if body_path.exists():
+            meta = json.loads(meta_path.read_text())
+            headers = {request: meta[response] for response, request in VALIDATORS if response in meta}
+    except (OSError, ValueError):
+        pass
+    
+    with SESSION.get(url, timeout=timeout, headers=headers, stream=True) as response:
+        if response.status_code == 304 and headers:
+            # Mark the entry as used so pruning keeps it
+            for path in (body_path, meta_path):
+                os.utime(path)
+            return body_path
+        response.raise_for_status()
+        
+        write_atomic(body_path, response.iter_content(chunk_size=64 * 1024))
+        meta = {name: response.headers[name] for name, _ in VALIDATORS if name in response.headers}
+        write_atomic(meta_path, [json.dumps(meta).encode()])
+    
+    return body_path
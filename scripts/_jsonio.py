@@ -0,0 +1,50 @@
+"""
+_jsonio.py - JSON file helpers for the local data files
+
+Uses orjson when it is installed (much faster than the stdlib, especially
+for indented output) and falls back to the json module otherwise.
+
+Usage:
+    from _jsonio import load_json, dump_json, parse_json
+    data = load_json(path)
+    dump_json(data, path)
+    data = parse_json(response.content)
+"""
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_json(data: bytes):
+    """Parse a JSON document from bytes (e.g. an HTTP response body)"""
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def load_json(path: Path):
+    """Read and parse a JSON file"""
+    with open(path, 'rb') as f:
+        if orjson is None:
+            return json.load(f)
+        return orjson.loads(f.read())
+
+
+def dump_json(data, path: Path, pretty: bool = True):
+    """Write data to a JSON file, indented by 2 spaces unless pretty=False"""
+    if orjson is None:
+        with open(path, 'w') as f:
+            if pretty:
+                json.dump(data, f, indent=2)
+            else:
+                json.dump(data, f, separators=(',', ':'))
+        return
+    
+    option = orjson.OPT_INDENT_2 if pretty else 0
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(data, option=option))
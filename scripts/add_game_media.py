@@ -8,12 +8,25 @@ Usage:
     python3 add_game_media.py --list 2026  # List all games and their media URLs
 """
 
-import boto3
 import argparse
+import time
 from botocore.exceptions import ClientError
 
-dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
-table = dynamodb.Table('courtvision-games')
+from _aws import get_resource, get_table
+
+DYNAMODB_TABLE = 'courtvision-games'
+MEDIA_FIELDS = 'pk, reddit_thread_url, youtube_highlights_url, youtube_postgame_url, game_context'
+
+# Boolean flags mirrored onto SEASON# entries -> METADATA attribute they track
+MEDIA_FLAGS = {
+    'has_reddit': 'reddit_thread_url',
+    'has_highlights': 'youtube_highlights_url',
+    'has_postgame': 'youtube_postgame_url',
+    'has_context': 'game_context',
+}
+
+dynamodb = get_resource()
+table = get_table(DYNAMODB_TABLE)
 
 
 def add_media(game_id: str, reddit_url: str = None, highlights_url: str = None, postgame_url: str = None, context: str = None):
@@ -56,11 +69,13 @@ def add_media(game_id: str, reddit_url: str = None, highlights_url: str = None,
         date = game.get('date', '').split('T')[0]
         
         # Update the game
-        table.update_item(
+        response = table.update_item(
             Key={'pk': f'GAME#{game_id}', 'sk': 'METADATA'},
             UpdateExpression='SET ' + ', '.join(update_parts),
-            ExpressionAttributeValues=expr_values
+            ExpressionAttributeValues=expr_values,
+            ReturnValues='ALL_NEW'
         )
+        sync_season_media_flags(response.get('Attributes', {}))
         
         print(f"✅ Updated: {date} vs {opponent} (ID: {game_id})")
         if reddit_url:
@@ -79,38 +94,100 @@ def add_media(game_id: str, reddit_url: str = None, highlights_url: str = None,
         return False
 
 
+def sync_season_media_flags(meta: dict):
+    """
+    Mirror a game's media flags onto its SEASON# entry so list_games can
+    render from a single Query. Entries rewritten by fetch_season_games, or
+    whose METADATA fetch_game_details rewrote, lose the flags until the next
+    media change; list_games falls back for those.
+    """
+    game_id = meta.get('game_id')
+    season = meta.get('season')
+    date = meta.get('date', '')
+    if not (game_id and season and date):
+        return
+    
+    flags = {flag: bool(meta.get(attr)) for flag, attr in MEDIA_FLAGS.items()}
+    
+    try:
+        table.update_item(
+            Key={'pk': f"SEASON#{int(season)}", 'sk': f"GAME#{date.split('T')[0]}#{game_id}"},
+            UpdateExpression='SET ' + ', '.join(f'{flag} = :{flag}' for flag in flags),
+            ExpressionAttributeValues={f':{flag}': value for flag, value in flags.items()},
+            ConditionExpression='attribute_exists(pk)'
+        )
+    except ClientError as e:
+        # No matching season entry - nothing to mirror onto
+        if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+            raise
+
+
+def get_media_metadata(game_ids: list) -> dict:
+    """Fetch media fields for many games with BatchGetItem, keyed by pk."""
+    results = {}
+    # A rescheduled game has two SEASON# rows, and BatchGetItem rejects
+    # duplicate keys
+    keys = [{'pk': f'GAME#{game_id}', 'sk': 'METADATA'} for game_id in dict.fromkeys(game_ids)]
+    
+    # BatchGetItem accepts at most 100 keys per request
+    for start in range(0, len(keys), 100):
+        request = {
+            DYNAMODB_TABLE: {
+                'Keys': keys[start:start + 100],
+                'ProjectionExpression': MEDIA_FIELDS,
+            }
+        }
+        delay = 0.1
+        
+        while request:
+            response = dynamodb.batch_get_item(RequestItems=request)
+            for item in response.get('Responses', {}).get(DYNAMODB_TABLE, []):
+                results[item['pk']] = item
+            
+            # Retry throttled keys with exponential backoff
+            request = response.get('UnprocessedKeys') or None
+            if request:
+                time.sleep(delay)
+                delay = min(delay * 2, 5)
+    
+    return results
+
+
 def list_games(season: int):
     """List all games and their media URLs for a season."""
     try:
+        # Sort keys are GAME#{date}#{game_id}, so items come back in date order
         response = table.query(
             KeyConditionExpression='pk = :pk',
-            ExpressionAttributeValues={':pk': f'SEASON#{season}'}
+            ExpressionAttributeValues={':pk': f'SEASON#{season}'},
+            ScanIndexForward=True
         )
         
-        games = sorted(response.get('Items', []), key=lambda x: x.get('date', ''))
+        games = response.get('Items', [])
+        completed = [g for g in games if g.get('status_completed')]
+        
+        # Only entries without mirrored flags need their METADATA fetched
+        media = get_media_metadata([g.get('game_id', '') for g in completed if 'has_reddit' not in g])
         
         print(f"\n🏀 Iowa Hawkeyes {season-1}-{str(season)[2:]} Season\n")
         print(f"{'Date':<12} {'Opponent':<20} {'Game ID':<12} {'Reddit':<8} {'Highlights':<11} {'Postgame':<9} {'Context':<8}")
         print("-" * 90)
         
-        for game in games:
-            if not game.get('status_completed'):
-                continue
-                
+        for game in completed:
             game_id = game.get('game_id', '')
             date = game.get('date', '').split('T')[0]
             opponent = game.get('opponent_abbrev', 'UNK')
             
-            # Fetch METADATA to check for media URLs
-            meta_response = table.get_item(
-                Key={'pk': f'GAME#{game_id}', 'sk': 'METADATA'}
-            )
-            meta = meta_response.get('Item', {})
+            if 'has_reddit' in game:
+                flags = {flag: game.get(flag) for flag in MEDIA_FLAGS}
+            else:
+                meta = media.get(f'GAME#{game_id}', {})
+                flags = {flag: meta.get(attr) for flag, attr in MEDIA_FLAGS.items()}
             
-            has_reddit = '✅' if meta.get('reddit_thread_url') else '❌'
-            has_highlights = '✅' if meta.get('youtube_highlights_url') else '❌'
-            has_postgame = '✅' if meta.get('youtube_postgame_url') else '❌'
-            has_context = '✅' if meta.get('game_context') else '❌'
+            has_reddit = '✅' if flags['has_reddit'] else '❌'
+            has_highlights = '✅' if flags['has_highlights'] else '❌'
+            has_postgame = '✅' if flags['has_postgame'] else '❌'
+            has_context = '✅' if flags['has_context'] else '❌'
             
             print(f"{date:<12} {opponent:<20} {game_id:<12} {has_reddit:<8} {has_highlights:<11} {has_postgame:<9} {has_context:<8}")
         
@@ -164,10 +241,12 @@ def remove_media(game_id: str, remove_reddit: bool = False, remove_highlights: b
         return False
     
     try:
-        table.update_item(
+        response = table.update_item(
             Key={'pk': f'GAME#{game_id}', 'sk': 'METADATA'},
-            UpdateExpression='REMOVE ' + ', '.join(remove_parts)
+            UpdateExpression='REMOVE ' + ', '.join(remove_parts),
+            ReturnValues='ALL_NEW'
         )
+        sync_season_media_flags(response.get('Attributes', {}))
         print(f"✅ Removed {', '.join(remove_parts)} from game {game_id}")
         return True
     except ClientError as e:
@@ -16,30 +16,61 @@ Usage:
     python3 analyze_patterns_v2.py --game 401713556   # Specific game
     python3 analyze_patterns_v2.py --season 2026      # Specific season
     python3 analyze_patterns_v2.py --clear            # Clear existing patterns first
+    python3 analyze_patterns_v2.py --cache            # Reuse reads from the last 5 minutes
 """
 
-import boto3
 import argparse
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from decimal import Decimal
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional
+
+from boto3.dynamodb.table import BatchWriter
+
+from _aws import disk_cache, get_thread_table, set_cache_enabled
 
 # Configuration
 DYNAMODB_TABLE = "courtvision-games"
 IOWA_TEAM_ID = "2294"
 
-# AWS clients
-dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
-table = dynamodb.Table(DYNAMODB_TABLE)
+# Only the attributes the detectors read are transferred
+GAME_PROJECTION = 'game_id, #d, opponent_abbrev, status_completed, details_fetched'
+GAME_ATTR_NAMES = {'#d': 'date'}
+PLAY_PROJECTION = '#seq, #p, scoring_play, team_id, score_value, player_id, player_name, #t, #txt'
+PLAY_ATTR_NAMES = {'#seq': 'sequence', '#p': 'period', '#t': 'type', '#txt': 'text'}
+
+# Action words that typically follow the player name in play text
+ACTION_WORDS = [
+    ' made ', ' missed ', ' Made ', ' Missed ',
+    ' Offensive Rebound', ' Defensive Rebound',
+    ' Turnover', ' Steal', ' Block', ' Foul',
+]
 
+# Precompiled keyword scans: one C-level pass per string instead of a chain
+# of `in` checks. The lookahead form reports overlapping matches so results
+# are identical to testing each substring separately.
+ACTION_RE = re.compile('(?=(%s))' % '|'.join(re.escape(a) for a in ACTION_WORDS))
+TEXT_FLAGS_RE = re.compile('free throw|missed|made', re.IGNORECASE)
+TYPE_FLAGS_RE = re.compile('(?=(free throw|miss|shot|layup|dunk|jumper))', re.IGNORECASE)
+MADE_SHOT_TYPES = {'shot', 'layup', 'dunk', 'jumper'}
 
+
+@disk_cache()
 def get_all_games(season: int) -> list:
-    """Get all completed games for a season"""
+    """Get all completed games for a season, in date order"""
+    table = get_thread_table(DYNAMODB_TABLE)
     games = []
     
     response = table.query(
         KeyConditionExpression='pk = :pk',
-        ExpressionAttributeValues={':pk': f"SEASON#{season}"}
+        ExpressionAttributeValues={':pk': f"SEASON#{season}"},
+        ProjectionExpression=GAME_PROJECTION,
+        ExpressionAttributeNames=GAME_ATTR_NAMES,
+        ScanIndexForward=True
     )
     
     for item in response.get('Items', []):
@@ -55,6 +86,9 @@ def get_all_games(season: int) -> list:
         response = table.query(
             KeyConditionExpression='pk = :pk',
             ExpressionAttributeValues={':pk': f"SEASON#{season}"},
+            ProjectionExpression=GAME_PROJECTION,
+            ExpressionAttributeNames=GAME_ATTR_NAMES,
+            ScanIndexForward=True,
             ExclusiveStartKey=response['LastEvaluatedKey']
         )
         for item in response.get('Items', []):
@@ -65,50 +99,80 @@ def get_all_games(season: int) -> list:
                     'opponent': item.get('opponent_abbrev', 'OPP'),
                 })
     
-    return sorted(games, key=lambda x: x['date'])
+    # SEASON# sort keys are GAME#{date}#{game_id}, so DynamoDB already
+    # returns games in date order
+    return games
 
 
+@lru_cache(maxsize=1024)
+@disk_cache()
 def get_game_metadata(game_id: str) -> dict:
-    """Get game metadata including team names"""
-    response = table.get_item(
+    """
+    Get game metadata including team names.
+    
+    Cached per process, and on disk for a few minutes with --cache;
+    callers must treat the returned dict as read-only.
+    """
+    response = get_thread_table(DYNAMODB_TABLE).get_item(
         Key={'pk': f"GAME#{game_id}", 'sk': 'METADATA'}
     )
     return response.get('Item', {})
 
 
+# Long-lived threads for get_all_plays' page prefetch, so each builds its
+# thread-local table once per run rather than once per game
+PREFETCH_POOL = ThreadPoolExecutor(max_workers=16)
+
+
+def query_plays_page(**query_kwargs) -> dict:
+    """Run one play Query on the calling thread's table"""
+    return get_thread_table(DYNAMODB_TABLE).query(**query_kwargs)
+
+
 def get_all_plays(game_id: str) -> list:
     """Get all plays for a game, sorted by sequence"""
     plays = []
-    
-    response = table.query(
-        KeyConditionExpression='pk = :pk AND begins_with(sk, :play)',
-        ExpressionAttributeValues={
+    query_kwargs = {
+        'KeyConditionExpression': 'pk = :pk AND begins_with(sk, :play)',
+        'ExpressionAttributeValues': {
             ':pk': f"GAME#{game_id}",
             ':play': 'PLAY#'
-        }
-    )
-    
-    plays.extend(response.get('Items', []))
+        },
+        'ProjectionExpression': PLAY_PROJECTION,
+        'ExpressionAttributeNames': PLAY_ATTR_NAMES,
+    }
     
-    # Handle pagination
-    while 'LastEvaluatedKey' in response:
-        response = table.query(
-            KeyConditionExpression='pk = :pk AND begins_with(sk, :play)',
-            ExpressionAttributeValues={
-                ':pk': f"GAME#{game_id}",
-                ':play': 'PLAY#'
-            },
-            ExclusiveStartKey=response['LastEvaluatedKey']
-        )
+    # Pages must be read in order, but the next page can be requested as soon
+    # as LastEvaluatedKey is known, overlapping its round-trip with our work
+    response = query_plays_page(**query_kwargs)
+    
+    while True:
+        next_page = None
+        if 'LastEvaluatedKey' in response:
+            next_page = PREFETCH_POOL.submit(
+                query_plays_page,
+                ExclusiveStartKey=response['LastEvaluatedKey'],
+                **query_kwargs
+            )
+        
         plays.extend(response.get('Items', []))
+        
+        if next_page is None:
+            break
+        response = next_page.result()
+    
+    # Parse the Decimal sequence once; sorting and run boundaries reuse it
+    for play in plays:
+        play['_seq'] = int(play.get('sequence', 0))
     
     # Sort by sequence number
-    plays.sort(key=lambda p: int(p.get('sequence', 0)))
+    plays.sort(key=itemgetter('_seq'))
     return plays
 
 
 def clear_existing_patterns(game_id: str) -> int:
     """Delete existing patterns for a game"""
+    table = get_thread_table(DYNAMODB_TABLE)
     count = 0
     
     response = table.query(
@@ -116,40 +180,34 @@ def clear_existing_patterns(game_id: str) -> int:
         ExpressionAttributeValues={
             ':pk': f"GAME#{game_id}",
             ':pattern': 'PATTERN#'
-        }
+        },
+        ProjectionExpression='pk, sk'
     )
     
-    for item in response.get('Items', []):
-        table.delete_item(Key={'pk': item['pk'], 'sk': item['sk']})
-        count += 1
+    with table.batch_writer() as batch:
+        for item in response.get('Items', []):
+            batch.delete_item(Key={'pk': item['pk'], 'sk': item['sk']})
+            count += 1
     
     return count
 
 
-def detect_scoring_run(window: list, iowa_team_id: str, opponent_team_id: str, window_size: int) -> dict:
-    """Check if a window of plays contains a scoring run"""
-    iowa_pts = 0
-    opponent_pts = 0
-    
-    for play in window:
-        if play.get('scoring_play'):
-            team_id = str(play.get('team_id', ''))
-            pts = int(play.get('score_value', 0))
-            
-            if team_id == iowa_team_id:
-                iowa_pts += pts
-            elif team_id == opponent_team_id:
-                opponent_pts += pts
-    
-    # Thresholds based on window size
-    thresholds = {
-        25: (8, 2),    # 8-2 run or better in 25 plays
-        50: (14, 4),   # 14-4 run or better in 50 plays
-        75: (18, 6),   # 18-6 run or better in 75 plays
-        100: (22, 8),  # 22-8 run or better in 100 plays
-    }
-    
-    min_points, max_opponent = thresholds.get(window_size, (8, 2))
+# Thresholds based on window size
+RUN_THRESHOLDS = {
+    25: (8, 2),    # 8-2 run or better in 25 plays
+    50: (14, 4),   # 14-4 run or better in 50 plays
+    75: (18, 6),   # 18-6 run or better in 75 plays
+    100: (22, 8),  # 22-8 run or better in 100 plays
+}
+
+
+# Window sizes scanned by find_scoring_runs, smallest first
+RUN_WINDOW_SIZES = (25, 50, 75)
+
+
+def classify_run(iowa_pts: int, opponent_pts: int, window_size: int) -> Optional[dict]:
+    """Decide whether a window's point totals qualify as a scoring run"""
+    min_points, max_opponent = RUN_THRESHOLDS.get(window_size, (8, 2))
     
     # Check if Iowa is on a run
     if iowa_pts >= min_points and opponent_pts <= max_opponent:
@@ -169,9 +227,44 @@ def detect_scoring_run(window: list, iowa_team_id: str, opponent_team_id: str, w
     return None
 
 
-def find_scoring_runs(plays: list, iowa_team_id: str, opponent_team_id: str, 
-                       iowa_name: str, opponent_name: str) -> list:
-    """Find all scoring runs in the game"""
+def points_prefix_sums(plays: list[dict], iowa_team_id: str, opponent_team_id: str) -> tuple[list[int], list[int]]:
+    """
+    Build running point totals for each team.
+    
+    iowa[k] - iowa[i] is Iowa's points over plays[i:k] (same for opponent),
+    so any window total is two lookups instead of a re-scan.
+    """
+    iowa: list[int] = [0]
+    opponent: list[int] = [0]
+    
+    for play in plays:
+        iowa_pts = 0
+        opponent_pts = 0
+        
+        if play.get('scoring_play'):
+            team_id = str(play.get('team_id', ''))
+            pts = int(play.get('score_value', 0))
+            
+            if team_id == iowa_team_id:
+                iowa_pts = pts
+            elif team_id == opponent_team_id:
+                opponent_pts = pts
+        
+        iowa.append(iowa[-1] + iowa_pts)
+        opponent.append(opponent[-1] + opponent_pts)
+    
+    return iowa, opponent
+
+
+def detect_scoring_run(window: list[dict], iowa_team_id: str, opponent_team_id: str, window_size: int) -> Optional[dict]:
+    """Check if a window of plays contains a scoring run"""
+    iowa, opponent = points_prefix_sums(window, iowa_team_id, opponent_team_id)
+    return classify_run(iowa[-1], opponent[-1], window_size)
+
+
+def find_scoring_runs(plays: list[dict], iowa_team_id: str, opponent_team_id: str, 
+                       iowa_name: str, opponent_name: str) -> list[dict]:
+    """Find all scoring runs in the game (plays as returned by get_all_plays)"""
     runs = []
     
     # Group plays by period
@@ -185,42 +278,51 @@ def find_scoring_runs(plays: list, iowa_team_id: str, opponent_team_id: str,
         if len(period_plays) < 25:
             continue
         
-        period_runs = []
+        iowa_prefix, opp_prefix = points_prefix_sums(period_plays, iowa_team_id, opponent_team_id)
         
-        # Try different window sizes
-        for window_size in [25, 50, 75]:
-            if window_size > len(period_plays):
-                continue
-            
-            for i in range(len(period_plays) - window_size + 1):
-                window = period_plays[i:i + window_size]
-                run = detect_scoring_run(window, iowa_team_id, opponent_team_id, window_size)
-                
-                if run:
-                    # Get start/end sequence numbers
-                    start_seq = int(window[0].get('sequence', 0))
-                    end_seq = int(window[-1].get('sequence', 0))
-                    
-                    period_runs.append({
-                        'team': iowa_name if run['is_iowa'] else opponent_name,
-                        'team_id': iowa_team_id if run['is_iowa'] else opponent_team_id,
-                        'is_iowa': run['is_iowa'],
-                        'points_for': run['points_for'],
-                        'points_against': run['points_against'],
-                        'period': period,
-                        'window_size': window_size,
-                        'start_sequence': start_seq,
-                        'end_sequence': end_seq,
-                    })
+        # One pass over start positions, checking every window size from the
+        # same prefix sums. The best run per team is kept as we go; ties go
+        # to the earliest (window size, start) so results match a
+        # size-by-size scan.
+        best_runs: dict[str, tuple] = {}  # team -> (points_for, order, start, window_size, run)
+        first_seen: dict[str, tuple[int, int]] = {}  # team -> order of its first qualifying window
         
-        # Deduplicate: keep the best run per team per period
-        best_runs = {}
-        for run in period_runs:
-            key = (run['period'], run['team'])
-            if key not in best_runs or run['points_for'] > best_runs[key]['points_for']:
-                best_runs[key] = run
+        for i in range(len(period_plays) - RUN_WINDOW_SIZES[0] + 1):
+            for size_index, window_size in enumerate(RUN_WINDOW_SIZES):
+                end = i + window_size
+                if end > len(period_plays):
+                    break
+                
+                run = classify_run(
+                    iowa_prefix[end] - iowa_prefix[i],
+                    opp_prefix[end] - opp_prefix[i],
+                    window_size
+                )
+                if not run:
+                    continue
+                
+                team = iowa_name if run['is_iowa'] else opponent_name
+                order = (size_index, i)
+                first_seen[team] = min(first_seen.get(team, order), order)
+                
+                best = best_runs.get(team)
+                if best is None or run['points_for'] > best[0] or (run['points_for'] == best[0] and order < best[1]):
+                    best_runs[team] = (run['points_for'], order, i, window_size, run)
         
-        runs.extend(best_runs.values())
+        for team in sorted(best_runs, key=first_seen.__getitem__):
+            _, _, start, window_size, run = best_runs[team]
+            
+            runs.append({
+                'team': team,
+                'team_id': iowa_team_id if run['is_iowa'] else opponent_team_id,
+                'is_iowa': run['is_iowa'],
+                'points_for': run['points_for'],
+                'points_against': run['points_against'],
+                'period': period,
+                'window_size': window_size,
+                'start_sequence': period_plays[start]['_seq'],
+                'end_sequence': period_plays[start + window_size - 1]['_seq'],
+            })
     
     return runs
 
@@ -235,14 +337,13 @@ def extract_player_name_from_text(text: str) -> str:
     if not text:
         return ''
     
-    action_words = [
-        ' made ', ' missed ', ' Made ', ' Missed ',
-        ' Offensive Rebound', ' Defensive Rebound',
-        ' Turnover', ' Steal', ' Block', ' Foul',
-    ]
+    found = set(ACTION_RE.findall(text))
+    if not found:
+        return ''
     
-    for action in action_words:
-        if action in text:
+    # Keep ACTION_WORDS priority order when several actions appear
+    for action in ACTION_WORDS:
+        if action in found:
             name = text.split(action)[0].strip()
             if len(name) >= 2 and not name.startswith('Team'):
                 return name
@@ -250,54 +351,58 @@ def extract_player_name_from_text(text: str) -> str:
     return ''
 
 
-def detect_hot_streaks(plays: list, iowa_team_id: str, iowa_name: str, opponent_name: str) -> list:
+def detect_hot_streaks(plays: list[dict], iowa_team_id: str, iowa_name: str, opponent_name: str) -> list[dict]:
     """Detect players with 3+ consecutive made field goals"""
-    hot_streaks = []
-    player_streaks = {}  # player_id -> streak info
+    best_streaks: dict[str, dict] = {}  # player_id -> longest qualifying streak
+    player_streaks: dict[str, dict] = {}  # player_id -> current streak info
     
     for play in plays:
         player_id = play.get('player_id')
         if not player_id:
             continue
         
-        play_type = (play.get('type', '') or '').lower()
         text = play.get('text', '') or ''
-        text_lower = text.lower()
+        type_flags = {m.lower() for m in TYPE_FLAGS_RE.findall(play.get('type', '') or '')}
+        text_flags = {m.lower() for m in TEXT_FLAGS_RE.findall(text)}
         scoring_play = play.get('scoring_play', False)
         
         # Skip free throws
-        if 'free throw' in play_type or 'free throw' in text_lower:
+        if 'free throw' in type_flags or 'free throw' in text_flags:
             continue
         
         # Check for made shot (field goal)
-        is_made_shot = scoring_play and ('made' in text_lower or 'shot' in play_type or 'layup' in play_type or 'dunk' in play_type or 'jumper' in play_type)
-        is_missed_shot = 'missed' in text_lower or 'miss' in play_type
+        is_made_shot = scoring_play and ('made' in text_flags or not type_flags.isdisjoint(MADE_SHOT_TYPES))
+        is_missed_shot = 'missed' in text_flags or 'miss' in type_flags
         
         if is_made_shot:
-            # Get player name - try field first, then extract from text
-            player_name = play.get('player_name', '') or extract_player_name_from_text(text)
+            streak = player_streaks.get(player_id)
             
-            if player_id not in player_streaks:
-                player_streaks[player_id] = {
-                    'count': 0,
-                    'player_name': player_name or 'Unknown',
-                    'team_id': play.get('team_id', ''),
-                    'period': play.get('period', 1),
-                }
-            
-            # Update name if we get a better one
-            if player_name and player_streaks[player_id]['player_name'] in ['Unknown', '']:
-                player_streaks[player_id]['player_name'] = player_name
+            # Only resolve the name when the streak still needs one
+            if streak is None or streak['player_name'] in ('Unknown', ''):
+                # Get player name - try field first, then extract from text
+                player_name = play.get('player_name', '') or extract_player_name_from_text(text)
+                
+                if streak is None:
+                    streak = player_streaks[player_id] = {
+                        'count': 0,
+                        'player_name': player_name or 'Unknown',
+                        'team_id': play.get('team_id', ''),
+                        'period': play.get('period', 1),
+                    }
+                elif player_name:
+                    # Update name if we get a better one
+                    streak['player_name'] = player_name
             
-            player_streaks[player_id]['count'] += 1
-            player_streaks[player_id]['last_period'] = play.get('period', 1)
+            streak['count'] += 1
+            streak['last_period'] = play.get('period', 1)
             
-            # Record streak if it qualifies (3+)
-            if player_streaks[player_id]['count'] >= 3:
-                streak = player_streaks[player_id]
+            # Keep only the longest qualifying (3+) streak per player, so
+            # there is no per-make record list to deduplicate afterwards
+            best = best_streaks.get(player_id)
+            if streak['count'] >= 3 and (best is None or streak['count'] > best['consecutive_makes']):
                 team_id = str(streak['team_id'])
                 
-                hot_streaks.append({
+                best_streaks[player_id] = {
                     'player_id': player_id,
                     'player_name': streak['player_name'],
                     'team': iowa_name if team_id == iowa_team_id else opponent_name,
@@ -305,25 +410,17 @@ def detect_hot_streaks(plays: list, iowa_team_id: str, iowa_name: str, opponent_
                     'is_iowa': team_id == iowa_team_id,
                     'consecutive_makes': streak['count'],
                     'period': streak['last_period'],
-                })
+                }
         
         elif is_missed_shot:
             # Reset streak on miss
-            if player_id in player_streaks:
-                del player_streaks[player_id]
-    
-    # Deduplicate - keep longest streak per player
-    best_streaks = {}
-    for streak in hot_streaks:
-        player_id = streak['player_id']
-        if player_id not in best_streaks or streak['consecutive_makes'] > best_streaks[player_id]['consecutive_makes']:
-            best_streaks[player_id] = streak
+            player_streaks.pop(player_id, None)
     
     return list(best_streaks.values())
 
 
-def store_pattern(game_id: str, pattern_type: str, pattern: dict, index: int):
-    """Store a pattern in DynamoDB"""
+def store_pattern(batch: BatchWriter, game_id: str, pattern_type: str, pattern: dict, index: int) -> None:
+    """Queue a pattern write on a DynamoDB batch writer"""
     timestamp = datetime.now().isoformat()
     
     # Build description
@@ -356,7 +453,7 @@ def store_pattern(game_id: str, pattern_type: str, pattern: dict, index: int):
         item['player_name'] = pattern['player_name']
         item['consecutive_makes'] = pattern['consecutive_makes']
     
-    table.put_item(Item=item)
+    batch.put_item(Item=item)
 
 
 def analyze_game(game_id: str, clear_existing: bool = True) -> dict:
@@ -365,6 +462,7 @@ def analyze_game(game_id: str, clear_existing: bool = True) -> dict:
         'game_id': game_id,
         'scoring_runs': 0,
         'hot_streaks': 0,
+        'cleared': 0,
         'success': False,
         'error': None,
     }
@@ -392,9 +490,7 @@ def analyze_game(game_id: str, clear_existing: bool = True) -> dict:
         
         # Clear existing patterns if requested
         if clear_existing:
-            cleared = clear_existing_patterns(game_id)
-            if cleared > 0:
-                print(f"   Cleared {cleared} existing patterns")
+            result['cleared'] = clear_existing_patterns(game_id)
         
         # Detect scoring runs
         scoring_runs = find_scoring_runs(
@@ -404,16 +500,18 @@ def analyze_game(game_id: str, clear_existing: bool = True) -> dict:
         # Detect hot streaks
         hot_streaks = detect_hot_streaks(plays, iowa_team_id, iowa_name, opponent_name)
         
-        # Store patterns
+        # Store patterns (batched into 25-item BatchWriteItem requests)
         pattern_index = 1
         
-        for run in scoring_runs:
-            store_pattern(game_id, 'scoring_run', run, pattern_index)
-            pattern_index += 1
-        
-        for streak in hot_streaks:
-            store_pattern(game_id, 'hot_streak', streak, pattern_index)
-            pattern_index += 1
+        table = get_thread_table(DYNAMODB_TABLE)
+        with table.batch_writer(overwrite_by_pkeys=['pk', 'sk']) as batch:
+            for run in scoring_runs:
+                store_pattern(batch, game_id, 'scoring_run', run, pattern_index)
+                pattern_index += 1
+            
+            for streak in hot_streaks:
+                store_pattern(batch, game_id, 'hot_streak', streak, pattern_index)
+                pattern_index += 1
         
         result['scoring_runs'] = len(scoring_runs)
         result['hot_streaks'] = len(hot_streaks)
@@ -425,14 +523,19 @@ def analyze_game(game_id: str, clear_existing: bool = True) -> dict:
     return result
 
 
-def main():
+def main() -> None:
     parser = argparse.ArgumentParser(description='Analyze games for patterns')
     parser.add_argument('--game', type=str, help='Specific game ID to analyze')
     parser.add_argument('--season', type=int, default=2026, help='Season to analyze (default: 2026)')
     parser.add_argument('--clear', action='store_true', help='Clear existing patterns before analyzing')
+    parser.add_argument('--workers', type=int, default=16, help='Games to analyze concurrently (default: 16)')
+    parser.add_argument('--cache', action='store_true', help='Reuse game/season reads cached on disk by runs in the last 5 minutes')
     
     args = parser.parse_args()
     
+    if args.cache:
+        set_cache_enabled(True)
+    
     print(f"\n🔍 Pattern Detection - CourtVision AI")
     print("=" * 60)
     
@@ -441,6 +544,8 @@ def main():
         print(f"📊 Analyzing game {args.game}...")
         result = analyze_game(args.game, clear_existing=args.clear)
         
+        if result['cleared'] > 0:
+            print(f"   Cleared {result['cleared']} existing patterns")
         if result['success']:
             print(f"✅ Found {result['scoring_runs']} scoring runs, {result['hot_streaks']} hot streaks")
         else:
@@ -460,22 +565,30 @@ def main():
     total_streaks = 0
     success_count = 0
     
-    for i, game in enumerate(games, 1):
-        game_id = game['game_id']
-        opponent = game['opponent']
-        date = game['date'].split('T')[0] if game['date'] else ''
-        
-        print(f"[{i}/{len(games)}] {date} vs {opponent}")
-        
-        result = analyze_game(game_id, clear_existing=args.clear)
+    # Each game is independent network I/O, so analyze them concurrently
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        futures = {
+            executor.submit(analyze_game, game['game_id'], args.clear): game
+            for game in games
+        }
         
-        if result['success']:
-            print(f"   ✅ {result['scoring_runs']} runs, {result['hot_streaks']} streaks")
-            total_runs += result['scoring_runs']
-            total_streaks += result['hot_streaks']
-            success_count += 1
-        else:
-            print(f"   ❌ {result['error']}")
+        for i, future in enumerate(as_completed(futures), 1):
+            game = futures[future]
+            opponent = game['opponent']
+            date = game['date'].split('T')[0] if game['date'] else ''
+            result = future.result()
+            
+            print(f"[{i}/{len(games)}] {date} vs {opponent}")
+            if result['cleared'] > 0:
+                print(f"   Cleared {result['cleared']} existing patterns")
+            
+            if result['success']:
+                print(f"   ✅ {result['scoring_runs']} runs, {result['hot_streaks']} streaks")
+                total_runs += result['scoring_runs']
+                total_streaks += result['hot_streaks']
+                success_count += 1
+            else:
+                print(f"   ❌ {result['error']}")
     
     # Summary
     print("\n" + "=" * 60)
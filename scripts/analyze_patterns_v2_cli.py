@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+analyze_patterns_v2_cli.py - Entry point for pattern detection
+
+Imports analyze_patterns_v2 as a module so that, if it has been compiled
+with mypyc (see README), the compiled extension is used instead of the
+source file. Accepts the same arguments as analyze_patterns_v2.py.
+
+Usage:
+    python3 analyze_patterns_v2_cli.py --season 2026
+"""
+
+from analyze_patterns_v2 import main
+
+
+if __name__ == '__main__':
+    main()
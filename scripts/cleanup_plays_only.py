@@ -1,10 +1,78 @@
-import boto3
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from _aws import get_table, get_thread_table
+
+table = get_table('courtvision-games')
+
+# Partitions that list a season's games: SEASON# from fetch_season_games,
+# SCHEDULE# from upload_to_dynamodb (both keyed on the season ending year)
+SEASON_PARTITIONS = ('SEASON', 'SCHEDULE')
+
+
+def query_all(**query_kwargs) -> list:
+    """Run a Query and follow LastEvaluatedKey until exhausted"""
+    table = get_thread_table('courtvision-games')
+    response = table.query(**query_kwargs)
+    items = response.get('Items', [])
+    
+    while 'LastEvaluatedKey' in response:
+        response = table.query(ExclusiveStartKey=response['LastEvaluatedKey'], **query_kwargs)
+        items.extend(response.get('Items', []))
+    
+    return items
+
+
+def get_game_ids(season: int) -> set:
+    """Get all game IDs listed for a season in any SEASON#/SCHEDULE# partition"""
+    game_ids = set()
+    
+    for prefix in SEASON_PARTITIONS:
+        items = query_all(
+            KeyConditionExpression='pk = :pk',
+            ExpressionAttributeValues={':pk': f"{prefix}#{season}"},
+            ProjectionExpression='game_id'
+        )
+        game_ids.update(item['game_id'] for item in items if item.get('game_id'))
+    
+    return game_ids
+
+
+def get_play_keys(game_id: str) -> list:
+    """Get the keys of every PLAY# record in a game partition"""
+    return query_all(
+        KeyConditionExpression='pk = :pk AND begins_with(sk, :play)',
+        ExpressionAttributeValues={':pk': f"GAME#{game_id}", ':play': 'PLAY#'},
+        ProjectionExpression='pk, sk'
+    )
+
+
+def delete_season_plays(seasons: list):
+    """Delete ONLY sk=PLAY# records of the given seasons' games, nothing else"""
+    print(f"Querying PLAY# records for seasons {', '.join(map(str, seasons))}...")
+    
+    game_ids = sorted(set().union(*(get_game_ids(season) for season in seasons)))
+    
+    # Query each game partition directly instead of scanning the whole table
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        play_keys = executor.map(get_play_keys, game_ids)
+        
+        deleted = 0
+        with table.batch_writer() as batch:
+            for game_id, items in zip(game_ids, play_keys):
+                if not items:
+                    continue
+                
+                print(f"  Deleting {len(items)} plays from game {game_id}...")
+                for item in items:
+                    batch.delete_item(Key={'pk': item['pk'], 'sk': item['sk']})
+                    deleted += 1
+    
+    print(f"\n✅ Deleted {deleted} PLAY# records")
 
-dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
-table = dynamodb.Table('courtvision-games')
 
 def delete_all_plays():
-    """Delete ONLY sk=PLAY# records, nothing else"""
+    """Delete ONLY sk=PLAY# records, nothing else (full table Scan)"""
     print("Scanning for PLAY# records...")
     
     deleted = 0
@@ -14,28 +82,44 @@ def delete_all_plays():
         'ProjectionExpression': 'pk, sk'
     }
     
-    while True:
-        response = table.scan(**scan_kwargs)
-        items = response.get('Items', [])
-        
-        if not items:
-            break
-        
-        print(f"  Deleting batch of {len(items)}...")
-        with table.batch_writer() as batch:
+    with table.batch_writer() as batch:
+        while True:
+            response = table.scan(**scan_kwargs)
+            items = response.get('Items', [])
+            
+            # A filtered page can be empty while more pages remain
+            if items:
+                print(f"  Deleting batch of {len(items)}...")
             for item in items:
                 batch.delete_item(Key={'pk': item['pk'], 'sk': item['sk']})
                 deleted += 1
-        
-        if 'LastEvaluatedKey' not in response:
-            break
-        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            
+            if 'LastEvaluatedKey' not in response:
+                break
+            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
     
     print(f"\n✅ Deleted {deleted} PLAY# records")
 
+
 if __name__ == '__main__':
-    confirm = input("Delete ALL PLAY# records? (yes/no): ")
+    parser = argparse.ArgumentParser(description='Delete PLAY# records from courtvision-games')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--season', type=int, action='append',
+                        help='Season ending year whose game plays are deleted (repeatable)')
+    target.add_argument('--all', action='store_true',
+                        help='Scan the whole table and delete every PLAY# record')
+    args = parser.parse_args()
+    
+    if args.all:
+        prompt = "Delete ALL PLAY# records? (yes/no): "
+    else:
+        prompt = f"Delete PLAY# records for seasons {', '.join(map(str, args.season))}? (yes/no): "
+    
+    confirm = input(prompt)
     if confirm.lower() == 'yes':
-        delete_all_plays()
+        if args.all:
+            delete_all_plays()
+        else:
+            delete_season_plays(args.season)
     else:
-        print("Aborted")
\ No newline at end of file
+        print("Aborted")
@@ -11,16 +11,33 @@ Example:
 """
 
 import argparse
-import json
-import time
+import os
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from _http import RateLimiter
+from _jsonio import load_json, dump_json
 
 # Import our fetcher modules
-from fetch_iowa_schedule import fetch_schedule, parse_schedule, save_schedule
+from fetch_iowa_schedule import fetch_schedule, parse_schedule, save_schedule, season_totals
 from fetch_playbyplay import fetch_game_summary, parse_game_data
 
 
+def fetch_and_write(game: dict, games_dir: Path, limiter: RateLimiter, pretty: bool = False) -> int:
+    """Fetch, parse and save one game; returns its play count"""
+    game_id = game['game_id']
+    
+    limiter.wait()
+    raw_data = fetch_game_summary(game_id)
+    parsed_data = parse_game_data(raw_data, game_id)
+    
+    # Same compact layout as fetch_playbyplay (--pretty indents)
+    dump_json(parsed_data, games_dir / f"game_{game_id}.json", pretty=pretty)
+    
+    return parsed_data.get('play_count', 0)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Collect all Iowa Hawkeyes game data')
     parser.add_argument('--season', type=int, default=2025,
@@ -28,7 +45,11 @@ def main():
     parser.add_argument('--output-dir', type=str, default='./data',
                        help='Base output directory')
     parser.add_argument('--delay', type=float, default=1.0,
-                       help='Delay between API calls in seconds')
+                       help='Minimum seconds between any two API calls (lower it to fetch faster)')
+    parser.add_argument('--workers', type=int, default=8,
+                       help='Number of games to fetch in parallel')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Indent game JSON files (default: compact)')
     parser.add_argument('--skip-pbp', action='store_true',
                        help='Skip play-by-play fetching (schedule only)')
     args = parser.parse_args()
@@ -49,8 +70,9 @@ def main():
     games = parse_schedule(raw_schedule)
     schedule_file = save_schedule(games, output_dir, args.season)
     
+    counts = season_totals(games)
     completed_games = [g for g in games if g.get('status_completed')]
-    print(f"  ✓ Found {len(games)} total games, {len(completed_games)} completed")
+    print(f"  ✓ Found {len(games)} total games, {counts['completed']} completed")
     
     if args.skip_pbp:
         print("\n[STEP 2/2] Skipping play-by-play (--skip-pbp flag set)")
@@ -63,41 +85,47 @@ def main():
         failed = []
         total_plays = 0
         
+        # Cached games are cheap local reads; only uncached ones go to ESPN.
+        # One directory listing replaces a stat() per game.
+        with os.scandir(games_dir) as entries:
+            existing = {entry.name for entry in entries}
+        
+        to_fetch = []
         for i, game in enumerate(completed_games, 1):
-            game_id = game['game_id']
-            game_file = games_dir / f"game_{game_id}.json"
+            game_name = f"game_{game['game_id']}.json"
             
-            # Check cache
-            if game_file.exists():
-                with open(game_file) as f:
-                    cached = json.load(f)
-                    total_plays += cached.get('play_count', 0)
-                    successful += 1
-                    opp = game.get('opponent', {}).get('abbreviation', 'OPP')
-                    print(f"  [{i}/{len(completed_games)}] vs {opp}: cached ({cached.get('play_count', 0)} plays)")
-                continue
-            
-            try:
-                raw_data = fetch_game_summary(game_id)
-                parsed_data = parse_game_data(raw_data, game_id)
-                
-                with open(game_file, 'w') as f:
-                    json.dump(parsed_data, f, indent=2)
-                
-                plays = parsed_data.get('play_count', 0)
-                total_plays += plays
+            if game_name in existing:
+                cached = load_json(games_dir / game_name)
+                total_plays += cached.get('play_count', 0)
                 successful += 1
-                
                 opp = game.get('opponent', {}).get('abbreviation', 'OPP')
-                date = game.get('date', '')[:10]
-                print(f"  [{i}/{len(completed_games)}] {date} vs {opp}: {plays} plays")
-                
-                if i < len(completed_games):
-                    time.sleep(args.delay)
+                print(f"  [{i}/{len(completed_games)}] vs {opp}: cached ({cached.get('play_count', 0)} plays)")
+                continue
+            
+            to_fetch.append(game)
+        
+        limiter = RateLimiter(args.delay)
+        
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            futures = {
+                executor.submit(fetch_and_write, game, games_dir, limiter, args.pretty): game
+                for game in to_fetch
+            }
+            
+            for done, future in enumerate(as_completed(futures), successful + 1):
+                game = futures[future]
+                try:
+                    plays = future.result()
+                    total_plays += plays
+                    successful += 1
+                    
+                    opp = game.get('opponent', {}).get('abbreviation', 'OPP')
+                    date = game.get('date', '')[:10]
+                    print(f"  [{done}/{len(completed_games)}] {date} vs {opp}: {plays} plays")
                     
-            except Exception as e:
-                failed.append({'game_id': game_id, 'error': str(e)})
-                print(f"  [{i}/{len(completed_games)}] ERROR: {e}")
+                except Exception as e:
+                    failed.append({'game_id': game['game_id'], 'error': str(e)})
+                    print(f"  [{done}/{len(completed_games)}] ERROR: {e}")
     
     # Summary
     elapsed = datetime.now() - start_time
@@ -107,8 +135,8 @@ def main():
     print("=" * 70)
     print(f"Season: {args.season-1}-{str(args.season)[2:]}")
     print(f"Total Games: {len(games)}")
-    print(f"  - Regular Season: {len([g for g in games if g.get('season_type_id') == '2'])}")
-    print(f"  - Postseason: {len([g for g in games if g.get('season_type_id') == '3'])}")
+    print(f"  - Regular Season: {counts['regular']}")
+    print(f"  - Postseason: {counts['postseason']}")
     
     if not args.skip_pbp:
         print(f"\nPlay-by-Play Data:")
@@ -14,58 +14,68 @@ Usage:
     python3 fetch_game_details.py --force           # Re-fetch all details
 """
 
-import boto3
 import requests
 import json
 import argparse
-import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
 from botocore.exceptions import ClientError
 
+from _aws import ParallelBatchWriter, get_table
+from _http import RateLimiter, cached_get
+
+try:
+    import ijson  # optional: stream-parse ESPN summaries
+except ImportError:
+    ijson = None
+
 # Configuration
 DYNAMODB_TABLE = "courtvision-games"
 ESPN_BASE_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/womens-college-basketball"
+SUMMARY_URL = f"{ESPN_BASE_URL}/summary?event={{}}"
 IOWA_TEAM_ID = "2294"
 
+# Top-level summary sections the parsers read; news, odds, win probability
+# etc. are skipped while streaming
+SUMMARY_KEYS = frozenset(('header', 'gameInfo', 'boxscore', 'plays'))
+
+# Media flags add_game_media mirrors onto SEASON# entries
+MEDIA_FLAGS = ('has_reddit', 'has_highlights', 'has_postgame', 'has_context')
+
 # AWS clients
-dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
-table = dynamodb.Table(DYNAMODB_TABLE)
+table = get_table(DYNAMODB_TABLE)
 
 
-class DecimalEncoder(json.JSONEncoder):
-    """Handle Decimal types for JSON"""
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super().default(obj)
+def decimal_to_float(obj):
+    """Copy a nested dict/list structure with Decimals converted to float"""
+    if isinstance(obj, dict):
+        return {key: decimal_to_float(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [decimal_to_float(value) for value in obj]
+    if isinstance(obj, Decimal):
+        return float(obj)
+    return obj
 
 
-def get_pending_games(season_value: int) -> list:
-    """Get completed games that don't have detailed data yet"""
+def get_season_games(season_value: int) -> list:
+    """Get every SEASON# entry for a season in one paginated query"""
     games = []
+    query_kwargs = {
+        'KeyConditionExpression': 'pk = :pk',
+        'ExpressionAttributeValues': {':pk': f"SEASON#{season_value}"},
+    }
     
     try:
-        response = table.query(
-            KeyConditionExpression='pk = :pk',
-            ExpressionAttributeValues={':pk': f"SEASON#{season_value}"}
-        )
-        
-        for item in response.get('Items', []):
-            # Only get completed games without details
-            if item.get('status_completed') and not item.get('details_fetched'):
-                games.append(item)
-        
-        # Handle pagination
-        while 'LastEvaluatedKey' in response:
-            response = table.query(
-                KeyConditionExpression='pk = :pk',
-                ExpressionAttributeValues={':pk': f"SEASON#{season_value}"},
-                ExclusiveStartKey=response['LastEvaluatedKey']
-            )
-            for item in response.get('Items', []):
-                if item.get('status_completed') and not item.get('details_fetched'):
-                    games.append(item)
+        while True:
+            response = table.query(**query_kwargs)
+            games.extend(response.get('Items', []))
+            
+            if 'LastEvaluatedKey' not in response:
+                break
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
                     
     except ClientError as e:
         print(f"⚠️  Error querying DynamoDB: {e}")
@@ -73,45 +83,33 @@ def get_pending_games(season_value: int) -> list:
     return games
 
 
-def get_all_completed_games(season_value: int) -> list:
-    """Get all completed games (for force re-fetch)"""
-    games = []
-    
-    try:
-        response = table.query(
-            KeyConditionExpression='pk = :pk',
-            ExpressionAttributeValues={':pk': f"SEASON#{season_value}"}
-        )
-        
-        for item in response.get('Items', []):
-            if item.get('status_completed'):
-                games.append(item)
-        
-        # Handle pagination
-        while 'LastEvaluatedKey' in response:
-            response = table.query(
-                KeyConditionExpression='pk = :pk',
-                ExpressionAttributeValues={':pk': f"SEASON#{season_value}"},
-                ExclusiveStartKey=response['LastEvaluatedKey']
-            )
-            for item in response.get('Items', []):
-                if item.get('status_completed'):
-                    games.append(item)
-                    
-    except ClientError as e:
-        print(f"⚠️  Error querying DynamoDB: {e}")
-    
-    return games
+def get_pending_games(season_games: list) -> list:
+    """Completed games that don't have detailed data yet"""
+    return [g for g in season_games if g.get('status_completed') and not g.get('details_fetched')]
+
+
+def get_all_completed_games(season_games: list) -> list:
+    """All completed games (for force re-fetch)"""
+    return [g for g in season_games if g.get('status_completed')]
 
 
 def fetch_game_summary(game_id: str) -> dict:
     """Fetch full game summary from ESPN"""
-    url = f"{ESPN_BASE_URL}/summary?event={game_id}"
+    url = SUMMARY_URL.format(game_id)
     
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
+    body_path = cached_get(url)
     
-    return response.json()
+    with open(body_path, 'rb') as f:
+        if ijson is None:
+            return json.load(f)
+        
+        # Stream the body and keep only the sections we parse, so the unused
+        # parts of the (multi-MB) summary are never held in memory together
+        return {
+            key: value
+            for key, value in ijson.kvitems(f, '', use_float=True)
+            if key in SUMMARY_KEYS
+        }
 
 
 def extract_player_name_from_text(text: str) -> str:
@@ -244,13 +242,37 @@ def parse_boxscore(summary: dict) -> dict:
     return result
 
 
+# Parsed games allowed to wait between the fetch and store stages
+PIPELINE_DEPTH = 4
+
+# Play attributes DynamoDB needs as Decimal
+COORDINATE_FIELDS = ('coordinate_x', 'coordinate_y')
+
+# ESPN boxscore stat columns: (field, index, cast, missing markers, default)
+_TEXT_MISSING = frozenset(('--',))
+_COUNT_MISSING = frozenset(('--', ''))
+STAT_SCHEMA = (
+    ('minutes', 0, None, _TEXT_MISSING, '0'),
+    ('points', 1, int, _COUNT_MISSING, 0),
+    ('field_goals', 2, None, _TEXT_MISSING, '0-0'),
+    ('three_pointers', 3, None, _TEXT_MISSING, '0-0'),
+    ('free_throws', 4, None, _TEXT_MISSING, '0-0'),
+    ('rebounds', 5, int, _COUNT_MISSING, 0),
+    ('assists', 6, int, _COUNT_MISSING, 0),
+    ('turnovers', 7, int, _COUNT_MISSING, 0),
+    ('steals', 8, int, _COUNT_MISSING, 0),
+    ('blocks', 9, int, _COUNT_MISSING, 0),
+    ('offensive_rebounds', 10, int, _COUNT_MISSING, 0),
+    ('defensive_rebounds', 11, int, _COUNT_MISSING, 0),
+    ('fouls', 12, int, _COUNT_MISSING, 0),
+)
+
+
 def parse_player_stats(athlete: dict) -> dict:
     """Parse individual player statistics"""
     athlete_info = athlete.get('athlete', {})
     stats = athlete.get('stats', [])
     
-    # ESPN stats order: MIN, PTS, FG, 3PT, FT, REB, AST, TO, STL, BLK, OREB, DREB, PF
-    
     player = {
         'player_id': athlete_info.get('id', ''),
         'player_name': athlete_info.get('displayName', ''),
@@ -258,22 +280,15 @@ def parse_player_stats(athlete: dict) -> dict:
         'position': athlete_info.get('position', {}).get('abbreviation', ''),
     }
     
-    if len(stats) >= 13:
+    if len(stats) >= len(STAT_SCHEMA):
         try:
-            player['minutes'] = stats[0] if stats[0] != '--' else '0'
-            player['points'] = int(stats[1]) if stats[1] not in ['--', ''] else 0
-            player['field_goals'] = stats[2] if stats[2] != '--' else '0-0'
-            player['three_pointers'] = stats[3] if stats[3] != '--' else '0-0'
-            player['free_throws'] = stats[4] if stats[4] != '--' else '0-0'
-            player['rebounds'] = int(stats[5]) if stats[5] not in ['--', ''] else 0
-            player['assists'] = int(stats[6]) if stats[6] not in ['--', ''] else 0
-            player['turnovers'] = int(stats[7]) if stats[7] not in ['--', ''] else 0
-            player['steals'] = int(stats[8]) if stats[8] not in ['--', ''] else 0
-            player['blocks'] = int(stats[9]) if stats[9] not in ['--', ''] else 0
-            player['offensive_rebounds'] = int(stats[10]) if stats[10] not in ['--', ''] else 0
-            player['defensive_rebounds'] = int(stats[11]) if stats[11] not in ['--', ''] else 0
-            player['fouls'] = int(stats[12]) if stats[12] not in ['--', ''] else 0
-        except (ValueError, IndexError) as e:
+            for name, idx, cast, missing, default in STAT_SCHEMA:
+                value = stats[idx]
+                if value in missing:
+                    player[name] = default
+                else:
+                    player[name] = cast(value) if cast else value
+        except ValueError as e:
             print(f"⚠️  Error parsing stats for {player['player_name']}: {e}")
     
     return player
@@ -309,6 +324,23 @@ def parse_venue(summary: dict) -> dict:
     return venue
 
 
+def team_info(comp: dict) -> dict:
+    """Build a METADATA team block from a header competitor"""
+    if comp is None:
+        return None
+    
+    team = comp.get('team', {})
+    return {
+        'team_id': str(team.get('id', '')),
+        'name': team.get('displayName', ''),
+        'abbreviation': team.get('abbreviation', ''),
+        'home_away': comp.get('homeAway', ''),
+        'score': str(comp.get('score', '0')),
+        'winner': comp.get('winner', False),
+        'period_scores': [str(p.get('value', 0)) for p in comp.get('linescores', [])]
+    }
+
+
 def build_metadata(game_id: str, season_value: int, summary: dict, plays: list, boxscore: dict) -> dict:
     """Build METADATA record in format frontend expects"""
     header = summary.get('header', {})
@@ -316,27 +348,17 @@ def build_metadata(game_id: str, season_value: int, summary: dict, plays: list,
     competition = competitions[0] if competitions else {}
     competitors = competition.get('competitors', [])
     
-    iowa_data = None
-    opponent_data = None
-    
+    # Pick the two competitors first, then build each team block once
+    iowa_comp = None
+    opponent_comp = None
     for comp in competitors:
-        team = comp.get('team', {})
-        team_id = str(team.get('id', ''))
-        
-        team_info = {
-            'team_id': team_id,
-            'name': team.get('displayName', ''),
-            'abbreviation': team.get('abbreviation', ''),
-            'home_away': comp.get('homeAway', ''),
-            'score': str(comp.get('score', '0')),
-            'winner': comp.get('winner', False),
-            'period_scores': [str(p.get('value', 0)) for p in comp.get('linescores', [])]
-        }
-        
-        if team_id == IOWA_TEAM_ID:
-            iowa_data = team_info
+        if str(comp.get('team', {}).get('id', '')) == IOWA_TEAM_ID:
+            iowa_comp = comp
         else:
-            opponent_data = team_info
+            opponent_comp = comp
+    
+    iowa_data = team_info(iowa_comp)
+    opponent_data = team_info(opponent_comp)
     
     # Get opponent team_id for player_stats
     opponent_team_id = opponent_data['team_id'] if opponent_data else ''
@@ -350,7 +372,7 @@ def build_metadata(game_id: str, season_value: int, summary: dict, plays: list,
         'entity_type': 'GAME',
         'game_id': game_id,
         'season': season_value,
-        'season_type': str(summary.get('header', {}).get('season', {}).get('type', 2)),
+        'season_type': str(header.get('season', {}).get('type', 2)),
         'date': competition.get('date', ''),
         'status': competition.get('status', {}).get('type', {}).get('description', 'Final'),
         'neutral_site': competition.get('neutralSite', False),
@@ -365,75 +387,142 @@ def build_metadata(game_id: str, season_value: int, summary: dict, plays: list,
             'opponent': boxscore.get('players', {}).get(opponent_team_id, [])
         },
         'fetched_at': datetime.now().isoformat() + 'Z',
+        'details_fetched': True,
+        'details_fetched_at': datetime.now().isoformat(),
     }
 
 
-def store_game_details(game_id: str, season_value: int, plays: list, boxscore: dict, summary: dict) -> bool:
-    """Store game details in DynamoDB"""
-    try:
-        # Build and store METADATA record (what frontend expects)
-        metadata = build_metadata(game_id, season_value, summary, plays, boxscore)
-        table.put_item(Item=metadata)
-        
-        # Store DETAILS record (for raw data backup)
-        detail_item = {
-            'pk': f"GAME#{game_id}",
-            'sk': 'DETAILS',
-            'game_id': game_id,
-            'season': season_value,
-            'play_count': len(plays),
-            'boxscore': json.loads(json.dumps(boxscore, cls=DecimalEncoder)),
-            'fetched_at': datetime.now().isoformat(),
+def store_game_details(batch, game_id: str, season_value: int, plays: list, boxscore: dict, summary: dict):
+    """
+    Queue a game's METADATA, DETAILS and PLAY records on the run's
+    ParallelBatchWriter.
+    
+    The caller owns the batch (one per run). Nothing is written until it
+    flushes, so write failures show up in batch.errors under the game's pk
+    once the writer has closed; only then are games marked as fetched - see
+    mark_details_fetched.
+    """
+    # Build and store METADATA record (what frontend expects)
+    metadata = build_metadata(game_id, season_value, summary, plays, boxscore)
+    batch.put_item(Item=metadata)
+    
+    # Store DETAILS record (for raw data backup)
+    detail_item = {
+        'pk': f"GAME#{game_id}",
+        'sk': 'DETAILS',
+        'game_id': game_id,
+        'season': season_value,
+        'play_count': len(plays),
+        'boxscore': decimal_to_float(boxscore),
+        'fetched_at': datetime.now().isoformat(),
+    }
+    batch.put_item(Item=detail_item)
+    
+    # Store plays
+    pk = f"GAME#{game_id}"
+    for play in plays:
+        play_item = {
+            'pk': pk,
+            'sk': f"PLAY#{int(play['sequence']):04d}",
+            'entity_type': 'PLAY',
+            **play
         }
-        table.put_item(Item=detail_item)
-        
-        # Store plays in batches
-        with table.batch_writer() as batch:
-            for play in plays:
-                play_item = {
-                    'pk': f"GAME#{game_id}",
-                    'sk': f"PLAY#{int(play['sequence']):04d}",
-                    'entity_type': 'PLAY',
-                    **play
-                }
-                # Convert any float coordinates to Decimal
-                if 'coordinate_x' in play_item and play_item['coordinate_x'] is not None:
-                    play_item['coordinate_x'] = Decimal(str(play_item['coordinate_x']))
-                if 'coordinate_y' in play_item and play_item['coordinate_y'] is not None:
-                    play_item['coordinate_y'] = Decimal(str(play_item['coordinate_y']))
-                
-                batch.put_item(Item=play_item)
-        
-        # Mark game as having details fetched
-        response = table.query(
-            KeyConditionExpression='pk = :pk AND begins_with(sk, :sk)',
-            ExpressionAttributeValues={
-                ':pk': f"SEASON#{season_value}",
-                ':sk': 'GAME#'
-            }
-        )
+        # Convert any float coordinates to Decimal (parse_plays sets both or neither)
+        if 'coordinate_x' in play:
+            for field in COORDINATE_FIELDS:
+                value = play.get(field)
+                if value is not None:
+                    play_item[field] = Decimal(str(value))
         
-        for item in response.get('Items', []):
-            if item.get('game_id') == game_id:
-                table.update_item(
-                    Key={'pk': item['pk'], 'sk': item['sk']},
-                    UpdateExpression='SET details_fetched = :val, details_fetched_at = :ts',
-                    ExpressionAttributeValues={
-                        ':val': True,
-                        ':ts': datetime.now().isoformat()
-                    }
-                )
-                break
-        
-        return True
+        batch.put_item(Item=play_item)
+
+
+def mark_details_fetched(season_keys: dict, game_ids: list):
+    """
+    Flag stored games on their SEASON# entries, after the batch is flushed.
+    
+    season_keys maps game_id -> SEASON# entry key for entries that need
+    updating (built once in main); games missing from it are skipped. The
+    media flags add_game_media mirrors onto the entry are removed, since the
+    rewritten METADATA no longer has the URLs they describe.
+    """
+    try:
+        fetched_at = datetime.now().isoformat()
         
+        for game_id in game_ids:
+            key = season_keys.get(game_id)
+            if not key:
+                continue
+            
+            table.update_item(
+                Key=key,
+                UpdateExpression=f"SET details_fetched = :val, details_fetched_at = :ts REMOVE {', '.join(MEDIA_FLAGS)}",
+                ExpressionAttributeValues={
+                    ':val': True,
+                    ':ts': fetched_at
+                }
+            )
+    
     except ClientError as e:
-        print(f"⚠️  Error storing game details: {e}")
-        return False
+        print(f"⚠️  Error marking games as fetched: {e}")
 
 
-def process_game(game_id: str, season_value: int) -> dict:
-    """Process a single game - fetch and store details"""
+def fetch_and_parse(game_id: str) -> dict:
+    """Fetch a game summary from ESPN and parse it (the network-bound stage)"""
+    summary = fetch_game_summary(game_id)
+    
+    return {
+        'summary': summary,
+        'plays': parse_plays(summary, game_id),
+        'boxscore': parse_boxscore(summary),
+    }
+
+
+def iter_fetched(game_ids: list, workers: int, delay: float):
+    """
+    Fetch and parse games on a thread pool, yielding (game_id, parsed) as
+    each one finishes so the caller can store it while others download.
+    
+    parsed is the raised exception if the fetch failed. Requests from all
+    workers start at least `delay` seconds apart. The hand-off queue is
+    bounded, so fetchers wait rather than pile up parsed games when storing
+    falls behind.
+    """
+    limiter = RateLimiter(delay)
+    done = queue.Queue(maxsize=PIPELINE_DEPTH)
+    stop = threading.Event()
+    
+    def produce(game_id):
+        try:
+            limiter.wait()
+            parsed = fetch_and_parse(game_id) if not stop.is_set() else None
+        except Exception as e:
+            parsed = e
+        
+        while not stop.is_set():
+            try:
+                done.put((game_id, parsed), timeout=0.5)
+                return
+            except queue.Full:
+                pass
+    
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for game_id in game_ids:
+            executor.submit(produce, game_id)
+        for _ in game_ids:
+            yield done.get()
+    finally:
+        # Unblock and drop any remaining fetchers if the consumer stops early
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def process_game(batch, game_id: str, season_value: int, parsed=None) -> dict:
+    """
+    Process a single game - fetch details (unless already fetched by
+    iter_fetched) and queue them on the batch
+    """
     result = {
         'game_id': game_id,
         'success': False,
@@ -444,27 +533,26 @@ def process_game(game_id: str, season_value: int) -> dict:
     }
     
     try:
-        # Fetch from ESPN
-        summary = fetch_game_summary(game_id)
+        # Fetch from ESPN and parse plays + boxscore
+        if parsed is None:
+            parsed = fetch_and_parse(game_id)
+        elif isinstance(parsed, Exception):
+            raise parsed
         
-        # Parse plays
-        plays = parse_plays(summary, game_id)
+        summary = parsed['summary']
+        plays = parsed['plays']
+        boxscore = parsed['boxscore']
         result['plays'] = len(plays)
-        
-        # Parse boxscore
-        boxscore = parse_boxscore(summary)
         result['players'] = sum(len(p) for p in boxscore.get('players', {}).values())
         
         # Parse venue for result display
         venue = parse_venue(summary)
         result['venue'] = venue.get('name', 'Unknown')
         
-        # Store in DynamoDB (now passing summary for METADATA creation)
-        if store_game_details(game_id, season_value, plays, boxscore, summary):
-            result['success'] = True
-        else:
-            result['error'] = "Failed to store in DynamoDB"
-            
+        # Queue for DynamoDB (now passing summary for METADATA creation)
+        store_game_details(batch, game_id, season_value, plays, boxscore, summary)
+        result['success'] = True
+        
     except requests.exceptions.RequestException as e:
         result['error'] = f"Network error: {e}"
     except Exception as e:
@@ -504,17 +592,49 @@ def main():
         help='Limit number of games to process (0 = no limit)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Games fetched from ESPN in parallel (default: 4)'
+    )
+    
+    parser.add_argument(
+        '--delay',
+        type=float,
+        default=1.0,
+        help='Minimum seconds between any two ESPN requests (default: 1.0)'
+    )
+    
     args = parser.parse_args()
     
     print(f"\n🏀 Fetching Game Details - {args.season - 1}-{str(args.season)[2:]} Season")
     print("=" * 60)
     
+    # One season query serves game selection and the details_fetched updates.
+    # Entries already flagged are left out so --force doesn't re-mark them,
+    # unless they carry media flags that the new METADATA invalidates; the
+    # METADATA item carries its own details_fetched either way.
+    season_games = get_season_games(args.season)
+    season_keys = {
+        g['game_id']: {'pk': g['pk'], 'sk': g['sk']}
+        for g in season_games
+        if g.get('game_id') and (not g.get('details_fetched') or 'has_reddit' in g)
+    }
+    
     if args.game:
         # Process specific game
         print(f"📡 Fetching game {args.game}...")
-        result = process_game(args.game, args.season)
+        with ParallelBatchWriter(DYNAMODB_TABLE, overwrite_by_pkeys=['pk', 'sk']) as batch:
+            result = process_game(batch, args.game, args.season)
+        
+        error = batch.errors.get(f"GAME#{args.game}")
+        if result['success'] and error:
+            result['success'] = False
+            result['error'] = f"Failed to store in DynamoDB: {error}"
         
         if result['success']:
+            mark_details_fetched(season_keys, [args.game])
             print(f"✅ Success! {result['plays']} plays, {result['players']} players")
             if result['venue']:
                 print(f"   📍 Venue: {result['venue']}")
@@ -525,9 +645,9 @@ def main():
     # Get games to process
     if args.force:
         print("⚠️  Force mode: Will re-fetch all completed games")
-        games = get_all_completed_games(args.season)
+        games = get_all_completed_games(season_games)
     else:
-        games = get_pending_games(args.season)
+        games = get_pending_games(season_games)
     
     print(f"📋 Found {len(games)} games to process")
     
@@ -539,36 +659,52 @@ def main():
         games = games[:args.limit]
         print(f"📋 Processing {len(games)} games (limit applied)")
     
-    # Process each game
-    success_count = 0
+    # Fetch on a worker pool while this thread queues finished games,
+    # streaming every item through one batch writer
     error_count = 0
-    
-    for i, game in enumerate(games, 1):
-        game_id = game['game_id']
-        opponent = game.get('opponent_abbrev', 'Unknown')
-        date = game.get('date', '').split('T')[0]
-        
-        print(f"\n[{i}/{len(games)}] {date} vs {opponent} (ID: {game_id})")
-        
-        result = process_game(game_id, args.season)
-        
-        if result['success']:
-            print(f"   ✅ {result['plays']} plays, {result['players']} players")
-            if result['venue']:
-                print(f"   📍 {result['venue']}")
-            success_count += 1
-        else:
-            print(f"   ❌ {result['error']}")
+    queued = []
+    by_id = {game['game_id']: game for game in games}
+    
+    with ParallelBatchWriter(DYNAMODB_TABLE, overwrite_by_pkeys=['pk', 'sk']) as batch:
+        fetched = iter_fetched(list(by_id), args.workers, args.delay)
+        for i, (game_id, parsed) in enumerate(fetched, 1):
+            game = by_id[game_id]
+            opponent = game.get('opponent_abbrev', 'Unknown')
+            date = game.get('date', '').split('T')[0]
+            
+            result = process_game(batch, game_id, args.season, parsed)
+            
+            # One write per game, so progress lines never interleave
+            lines = [f"\n[{i}/{len(games)}] {date} vs {opponent} (ID: {game_id})"]
+            if result['success']:
+                lines.append(f"   📤 {result['plays']} plays, {result['players']} players queued")
+                if result['venue']:
+                    lines.append(f"   📍 {result['venue']}")
+                queued.append(game_id)
+            else:
+                lines.append(f"   ❌ {result['error']}")
+                error_count += 1
+            print('\n'.join(lines))
+    
+    # Writes only complete when the writer closes; report the games whose
+    # records failed and flag only the ones that were fully stored
+    stored = []
+    for game_id in queued:
+        error = batch.errors.get(f"GAME#{game_id}")
+        if error:
+            game = by_id[game_id]
+            date = game.get('date', '').split('T')[0]
+            print(f"❌ {date} vs {game.get('opponent_abbrev', 'Unknown')} (ID: {game_id}): Failed to store in DynamoDB: {error}")
             error_count += 1
-        
-        # Be nice to ESPN's servers
-        if i < len(games):
-            time.sleep(1)
+        else:
+            stored.append(game_id)
+    
+    mark_details_fetched(season_keys, stored)
     
     # Summary
     print("\n" + "=" * 60)
     print(f"📊 SUMMARY")
-    print(f"   ✅ Successful: {success_count}")
+    print(f"   ✅ Successful: {len(stored)}")
     print(f"   ❌ Errors: {error_count}")
     print("=" * 60)
 
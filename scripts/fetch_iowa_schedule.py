@@ -11,17 +11,22 @@ Example:
 """
 
 import argparse
-import json
-import requests
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+from _http import cached_get
+from _jsonio import load_json, dump_json
+
 
 # ESPN API Configuration
 IOWA_TEAM_ID = "2294"
 BASE_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/womens-college-basketball"
+SCHEDULE_URL = f"{BASE_URL}/teams/{IOWA_TEAM_ID}/schedule?season={{}}"
 
 
+@lru_cache(maxsize=8)
 def fetch_schedule(season_year: int) -> dict:
     """
     Fetch Iowa's schedule for a given season.
@@ -30,14 +35,12 @@ def fetch_schedule(season_year: int) -> dict:
         season_year: The ending year of the season (e.g., 2025 for 2024-25 season)
     
     Returns:
-        Raw API response as dictionary
+        Raw API response as dictionary (cached per season for the run)
     """
-    url = f"{BASE_URL}/teams/{IOWA_TEAM_ID}/schedule?season={season_year}"
+    url = SCHEDULE_URL.format(season_year)
     print(f"Fetching: {url}")
     
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
-    return response.json()
+    return load_json(cached_get(url))
 
 
 def parse_schedule(raw_data: dict) -> list[dict]:
@@ -48,28 +51,32 @@ def parse_schedule(raw_data: dict) -> list[dict]:
         List of game dictionaries with essential info
     """
     games = []
-    events = raw_data.get('events', [])
     
-    for event in events:
+    for event in raw_data.get('events', []):
+        season = event.get('season', {})
+        season_type = event.get('seasonType', {})
+        
         game = {
             'game_id': event.get('id'),
             'date': event.get('date'),
             'name': event.get('name'),
             'short_name': event.get('shortName'),
-            'season_year': event.get('season', {}).get('year'),
-            'season_type_id': event.get('seasonType', {}).get('id'),
-            'season_type': event.get('seasonType', {}).get('name'),
+            'season_year': season.get('year'),
+            'season_type_id': season_type.get('id'),
+            'season_type': season_type.get('name'),
         }
         
         # Parse competition details
         competitions = event.get('competitions', [])
         if competitions:
             comp = competitions[0]
+            status_type = comp.get('status', {}).get('type', {})
+            
             game['venue'] = comp.get('venue', {}).get('fullName', 'Unknown')
             game['attendance'] = comp.get('attendance')
             game['neutral_site'] = comp.get('neutralSite', False)
-            game['status'] = comp.get('status', {}).get('type', {}).get('description', 'Unknown')
-            game['status_completed'] = comp.get('status', {}).get('type', {}).get('completed', False)
+            game['status'] = status_type.get('description', 'Unknown')
+            game['status_completed'] = status_type.get('completed', False)
             
             # Tournament round info
             notes = comp.get('notes', [])
@@ -78,10 +85,11 @@ def parse_schedule(raw_data: dict) -> list[dict]:
             
             # Parse competitors
             for competitor in comp.get('competitors', []):
-                team_abbrev = competitor.get('team', {}).get('abbreviation')
+                team = competitor.get('team', {})
+                team_abbrev = team.get('abbreviation')
                 team_data = {
-                    'team_id': competitor.get('team', {}).get('id'),
-                    'name': competitor.get('team', {}).get('displayName'),
+                    'team_id': team.get('id'),
+                    'name': team.get('displayName'),
                     'abbreviation': team_abbrev,
                     'score': competitor.get('score', {}).get('displayValue'),
                     'winner': competitor.get('winner', False),
@@ -91,12 +99,12 @@ def parse_schedule(raw_data: dict) -> list[dict]:
                 # Get game leaders
                 leaders = {}
                 for leader_cat in competitor.get('leaders', []):
-                    cat_name = leader_cat.get('abbreviation', '').lower()
                     leader_list = leader_cat.get('leaders', [])
                     if leader_list:
-                        leaders[cat_name] = {
-                            'player': leader_list[0].get('athlete', {}).get('displayName'),
-                            'value': leader_list[0].get('displayValue')
+                        top = leader_list[0]
+                        leaders[leader_cat.get('abbreviation', '').lower()] = {
+                            'player': top.get('athlete', {}).get('displayName'),
+                            'value': top.get('displayValue')
                         }
                 team_data['leaders'] = leaders
                 
@@ -110,23 +118,43 @@ def parse_schedule(raw_data: dict) -> list[dict]:
     return games
 
 
+def season_totals(games: list[dict]) -> Counter:
+    """
+    Count regular season, postseason and completed games plus Iowa wins
+    in a single pass over the schedule.
+    """
+    counts = Counter()
+    for game in games:
+        season_type_id = game.get('season_type_id')
+        if season_type_id == '2':
+            counts['regular'] += 1
+        elif season_type_id == '3':
+            counts['postseason'] += 1
+        
+        if game.get('status_completed'):
+            counts['completed'] += 1
+            if game.get('iowa', {}).get('winner'):
+                counts['wins'] += 1
+    
+    return counts
+
+
 def print_schedule_summary(games: list[dict]) -> None:
     """Print a formatted summary of the schedule."""
-    regular = [g for g in games if g.get('season_type_id') == '2']
-    postseason = [g for g in games if g.get('season_type_id') == '3']
+    counts = season_totals(games)
     completed = [g for g in games if g.get('status_completed')]
     
     print("\n" + "=" * 70)
     print("IOWA HAWKEYES SCHEDULE SUMMARY")
     print("=" * 70)
     print(f"Total Games: {len(games)}")
-    print(f"  Regular Season: {len(regular)}")
-    print(f"  Postseason (NCAA Tournament): {len(postseason)}")
-    print(f"  Completed: {len(completed)}")
+    print(f"  Regular Season: {counts['regular']}")
+    print(f"  Postseason (NCAA Tournament): {counts['postseason']}")
+    print(f"  Completed: {counts['completed']}")
     
     # Win/Loss record for completed games
-    wins = sum(1 for g in completed if g.get('iowa', {}).get('winner'))
-    losses = len(completed) - wins
+    wins = counts['wins']
+    losses = counts['completed'] - wins
     print(f"  Record: {wins}-{losses}")
     
     print("\n" + "-" * 70)
@@ -161,14 +189,13 @@ def save_schedule(games: list[dict], output_dir: Path, season_year: int) -> Path
     output_dir.mkdir(parents=True, exist_ok=True)
     output_file = output_dir / f"iowa_schedule_{season_year}.json"
     
-    with open(output_file, 'w') as f:
-        json.dump({
-            'fetched_at': datetime.utcnow().isoformat() + 'Z',
-            'team_id': IOWA_TEAM_ID,
-            'season_year': season_year,
-            'total_games': len(games),
-            'games': games
-        }, f, indent=2)
+    dump_json({
+        'fetched_at': datetime.utcnow().isoformat() + 'Z',
+        'team_id': IOWA_TEAM_ID,
+        'season_year': season_year,
+        'total_games': len(games),
+        'games': games
+    }, output_file)
     
     print(f"\nSchedule saved to: {output_file}")
     return output_file
@@ -9,14 +9,37 @@ Usage:
 """
 
 import argparse
-import json
-import time
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from typing import Any
+
+from _http import RateLimiter, cached_get
+from _jsonio import load_json, dump_json, parse_json
+
+try:
+    import msgspec  # optional: decode only the summary sections we use
+except ImportError:
+    msgspec = None
 
 
 BASE_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/womens-college-basketball"
+SUMMARY_URL = f"{BASE_URL}/summary?event={{}}"
+
+
+if msgspec is not None:
+    class SummarySections(msgspec.Struct):
+        """
+        Top-level summary sections parse_game_data reads. Everything else
+        (news, odds, win probability, ...) is skipped without being decoded.
+        """
+        header: Any = msgspec.UNSET
+        boxscore: Any = msgspec.UNSET
+        plays: Any = msgspec.UNSET
+    
+    class PlayCountOnly(msgspec.Struct):
+        """The one field needed from an already-saved game file"""
+        play_count: Any = 0
 
 
 def fetch_game_summary(game_id: str) -> dict:
@@ -29,12 +52,32 @@ def fetch_game_summary(game_id: str) -> dict:
     Returns:
         Raw API response as dictionary
     """
-    url = f"{BASE_URL}/summary?event={game_id}"
+    url = SUMMARY_URL.format(game_id)
     print(f"  Fetching game {game_id}...")
     
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
-    return response.json()
+    body = cached_get(url).read_bytes()
+    
+    if msgspec is None:
+        return parse_json(body)
+    
+    # Keep only sections present in the response, as a full decode would
+    sections = msgspec.json.decode(body, type=SummarySections)
+    return {
+        name: value
+        for name in SummarySections.__struct_fields__
+        if (value := getattr(sections, name)) is not msgspec.UNSET
+    }
+
+
+def team_role_of(team: dict, team_role: dict) -> str:
+    """
+    'iowa' or 'opponent' for a boxscore team, looked up by team id. Falls
+    back to the display name when the header didn't identify the team.
+    """
+    role = team_role.get(team.get('id'))
+    if role is None:
+        role = 'iowa' if 'Iowa' in team.get('displayName', '') else 'opponent'
+    return role
 
 
 def parse_game_data(raw_data: dict, game_id: str) -> dict:
@@ -98,13 +141,17 @@ def parse_game_data(raw_data: dict, game_id: str) -> dict:
     if boxscore:
         game['boxscore'] = {}
         
+        # Which side each team id is on, from the header competitors
+        team_role = {}
+        for role in ('iowa', 'opponent'):
+            team_id = game.get(role, {}).get('team_id')
+            if team_id:
+                team_role[team_id] = role
+        
         for team_box in boxscore.get('teams', []):
             team_stats = team_box.get('statistics', [])
-            team_abbrev = None
             
-            # Get team abbreviation from display name
-            display_name = team_box.get('team', {}).get('displayName', '')
-            if 'Iowa' in display_name:
+            if team_role_of(team_box.get('team', {}), team_role) == 'iowa':
                 team_abbrev = 'IOWA'
             else:
                 team_abbrev = game.get('opponent', {}).get('abbreviation', 'OPP')
@@ -121,84 +168,106 @@ def parse_game_data(raw_data: dict, game_id: str) -> dict:
         game['player_stats'] = {}
         
         for team_players in players:
-            team_name = team_players.get('team', {}).get('displayName', '')
-            team_key = 'iowa' if 'Iowa' in team_name else 'opponent'
-            game['player_stats'][team_key] = []
+            team_key = team_role_of(team_players.get('team', {}), team_role)
+            game['player_stats'][team_key] = player_rows = []
             
             for stat_section in team_players.get('statistics', []):
                 stat_keys = stat_section.get('keys', [])
                 
                 for athlete in stat_section.get('athletes', []):
+                    athlete_info = athlete.get('athlete', {})
                     player = {
-                        'player_id': athlete.get('athlete', {}).get('id'),
-                        'name': athlete.get('athlete', {}).get('displayName'),
-                        'jersey': athlete.get('athlete', {}).get('jersey'),
-                        'position': athlete.get('athlete', {}).get('position', {}).get('abbreviation'),
+                        'player_id': athlete_info.get('id'),
+                        'name': athlete_info.get('displayName'),
+                        'jersey': athlete_info.get('jersey'),
+                        'position': athlete_info.get('position', {}).get('abbreviation'),
                         'starter': athlete.get('starter', False),
                     }
                     
-                    # Map stats
-                    stat_values = athlete.get('stats', [])
-                    for i, key in enumerate(stat_keys):
-                        if i < len(stat_values):
-                            player[key.lower()] = stat_values[i]
+                    # Map stats (zip stops at the shorter of keys / values)
+                    for key, value in zip(stat_keys, athlete.get('stats', [])):
+                        player[key.lower()] = value
                     
-                    game['player_stats'][team_key].append(player)
+                    player_rows.append(player)
     
     # Parse plays (the key data for our analytics!)
     plays = raw_data.get('plays', [])
-    game['plays'] = []
+    game['plays'] = parsed_plays = []
     game['play_count'] = len(plays)
+    append = parsed_plays.append
     
     for play in plays:
+        get = play.get
+        play_type = get('type', {})
         parsed_play = {
-            'play_id': play.get('id'),
-            'sequence': play.get('sequenceNumber'),
-            'period': play.get('period', {}).get('number'),
-            'clock': play.get('clock', {}).get('displayValue'),
-            'team_id': play.get('team', {}).get('id'),
-            'type': play.get('type', {}).get('text'),
-            'type_id': play.get('type', {}).get('id'),
-            'text': play.get('text'),
-            'scoring_play': play.get('scoringPlay', False),
-            'score_value': play.get('scoreValue'),
-            'away_score': play.get('awayScore'),
-            'home_score': play.get('homeScore'),
-            'wallclock': play.get('wallClock'),
+            'play_id': get('id'),
+            'sequence': get('sequenceNumber'),
+            'period': get('period', {}).get('number'),
+            'clock': get('clock', {}).get('displayValue'),
+            'team_id': get('team', {}).get('id'),
+            'type': play_type.get('text'),
+            'type_id': play_type.get('id'),
+            'text': get('text'),
+            'scoring_play': get('scoringPlay', False),
+            'score_value': get('scoreValue'),
+            'away_score': get('awayScore'),
+            'home_score': get('homeScore'),
+            'wallclock': get('wallClock'),
         }
         
         # Participants (players involved)
-        participants = play.get('participants', [])
+        participants = get('participants')
         if participants:
             parsed_play['participants'] = [
-                {
-                    'player_id': p.get('athlete', {}).get('id'),
-                    'name': p.get('athlete', {}).get('displayName'),
-                }
-                for p in participants
+                {'player_id': athlete.get('id'), 'name': athlete.get('displayName')}
+                for athlete in (p.get('athlete', {}) for p in participants)
             ]
         
-        game['plays'].append(parsed_play)
+        append(parsed_play)
     
     return game
 
 
-def fetch_games_from_schedule(schedule_file: Path, output_dir: Path, delay: float = 1.0) -> list[dict]:
+def load_play_count(game_file: Path) -> int:
+    """Read just play_count from a saved game file"""
+    if msgspec is None:
+        return load_json(game_file).get('play_count', 0)
+    return msgspec.json.decode(game_file.read_bytes(), type=PlayCountOnly).play_count
+
+
+def fetch_and_save(game_id: str, game_file: Path, limiter: RateLimiter, pretty: bool = False) -> dict:
+    """Fetch, parse and save one game (runs on a worker thread)"""
+    limiter.wait()
+    raw_data = fetch_game_summary(game_id)
+    parsed_data = parse_game_data(raw_data, game_id)
+    
+    # Save individual game file (compact unless a human will read it)
+    dump_json(parsed_data, game_file, pretty=pretty)
+    return parsed_data
+
+
+def fetch_games_from_schedule(schedule_file: Path, output_dir: Path, delay: float = 1.0,
+                              workers: int = 8, pretty: bool = False,
+                              reload: bool = False) -> list[dict]:
     """
     Fetch play-by-play for all completed games in a schedule file.
     
     Args:
         schedule_file: Path to schedule JSON file
         output_dir: Directory to save individual game files
-        delay: Seconds to wait between API calls (be nice to ESPN)
+        delay: Minimum seconds between any two API calls (be nice to ESPN)
+        workers: Number of games fetched in parallel
+        pretty: Indent the saved game files for reading
+        reload: Fully load already-saved games instead of returning a
+            {'game_id', 'play_count'} stub for them
     
     Returns:
-        List of parsed game data
+        List of parsed game data (stubs for saved games unless reload),
+        in schedule order
     """
-    with open(schedule_file) as f:
-        schedule = json.load(f)
+    schedule = load_json(schedule_file)
     
-    games_data = []
+    games_data = {}
     completed_games = [g for g in schedule['games'] if g.get('status_completed')]
     
     print(f"\nFetching play-by-play for {len(completed_games)} completed games...")
@@ -206,40 +275,41 @@ def fetch_games_from_schedule(schedule_file: Path, output_dir: Path, delay: floa
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    for i, game in enumerate(completed_games, 1):
-        game_id = game['game_id']
-        
-        # Check if we already have this game
-        game_file = output_dir / f"game_{game_id}.json"
-        if game_file.exists():
-            print(f"  [{i}/{len(completed_games)}] Game {game_id} already fetched, skipping...")
-            with open(game_file) as f:
-                games_data.append(json.load(f))
-            continue
+    limiter = RateLimiter(delay)
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
         
-        try:
-            raw_data = fetch_game_summary(game_id)
-            parsed_data = parse_game_data(raw_data, game_id)
-            
-            # Save individual game file
-            with open(game_file, 'w') as f:
-                json.dump(parsed_data, f, indent=2)
-            
-            games_data.append(parsed_data)
+        for i, game in enumerate(completed_games, 1):
+            game_id = game['game_id']
             
-            date = game.get('date', '')[:10]
-            plays = parsed_data.get('play_count', 0)
-            opp = game.get('opponent', {}).get('abbreviation', 'OPP')
-            print(f"  [{i}/{len(completed_games)}] {date} vs {opp}: {plays} plays fetched")
+            # Check if we already have this game
+            game_file = output_dir / f"game_{game_id}.json"
+            if game_file.exists():
+                print(f"  [{i}/{len(completed_games)}] Game {game_id} already fetched, skipping...")
+                if reload:
+                    games_data[i] = load_json(game_file)
+                else:
+                    games_data[i] = {'game_id': game_id, 'play_count': load_play_count(game_file)}
+                continue
             
-            # Be nice to the API
-            if i < len(completed_games):
-                time.sleep(delay)
+            futures[executor.submit(fetch_and_save, game_id, game_file, limiter, pretty)] = (i, game)
+        
+        for future in as_completed(futures):
+            i, game = futures[future]
+            try:
+                parsed_data = future.result()
+                games_data[i] = parsed_data
+                
+                date = game.get('date', '')[:10]
+                plays = parsed_data.get('play_count', 0)
+                opp = game.get('opponent', {}).get('abbreviation', 'OPP')
+                print(f"  [{i}/{len(completed_games)}] {date} vs {opp}: {plays} plays fetched")
                 
-        except Exception as e:
-            print(f"  [{i}/{len(completed_games)}] ERROR fetching {game_id}: {e}")
+            except Exception as e:
+                print(f"  [{i}/{len(completed_games)}] ERROR fetching {game['game_id']}: {e}")
     
-    return games_data
+    return [games_data[i] for i in sorted(games_data)]
 
 
 def main():
@@ -250,7 +320,13 @@ def main():
     parser.add_argument('--output-dir', type=str, default='./data/games',
                        help='Output directory for game JSON files')
     parser.add_argument('--delay', type=float, default=1.0,
-                       help='Delay between API calls in seconds')
+                       help='Minimum seconds between any two API calls (lower it to fetch faster)')
+    parser.add_argument('--workers', type=int, default=8,
+                       help='Number of games to fetch in parallel')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Indent game JSON files (default: compact)')
+    parser.add_argument('--reload', action='store_true',
+                       help='Fully load already-fetched games instead of just their play counts')
     args = parser.parse_args()
     
     output_dir = Path(args.output_dir)
@@ -264,8 +340,7 @@ def main():
         output_dir.mkdir(parents=True, exist_ok=True)
         output_file = output_dir / f"game_{args.game_id}.json"
         
-        with open(output_file, 'w') as f:
-            json.dump(parsed_data, f, indent=2)
+        dump_json(parsed_data, output_file, pretty=args.pretty)
         
         print(f"\n✓ Game saved to: {output_file}")
         print(f"  Plays: {parsed_data.get('play_count', 0)}")
@@ -278,7 +353,8 @@ def main():
             return
         
         print(f"CourtVision AI - Batch Play-by-Play Fetcher")
-        games = fetch_games_from_schedule(schedule_path, output_dir, args.delay)
+        games = fetch_games_from_schedule(schedule_path, output_dir, args.delay, args.workers,
+                                          args.pretty, args.reload)
         
         total_plays = sum(g.get('play_count', 0) for g in games)
         print(f"\n" + "=" * 60)
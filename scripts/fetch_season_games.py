@@ -17,22 +17,27 @@ Usage:
     python3 fetch_season_games.py --force           # Re-fetch all games (updates existing)
 """
 
-import boto3
 import requests
-import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
 from botocore.exceptions import ClientError
 
+from _aws import get_table, get_thread_table
+from _http import SESSION
+from _jsonio import parse_json
+
 # Configuration
 IOWA_TEAM_ID = "2294"
 DYNAMODB_TABLE = "courtvision-games"
 ESPN_BASE_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/womens-college-basketball"
 
+# Fields games_are_different compares ('status' is a reserved word)
+EXISTING_PROJECTION = 'game_id, status_completed, iowa_score, opponent_score, #s'
+
 # AWS clients
-dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
-table = dynamodb.Table(DYNAMODB_TABLE)
+table = get_table(DYNAMODB_TABLE)
 
 
 def get_season_label(season_value: int) -> str:
@@ -49,9 +54,9 @@ def fetch_espn_schedule(season_value: int) -> list:
     
     print(f"📡 Fetching from ESPN: {url}")
     
-    response = requests.get(url, timeout=30)
+    response = SESSION.get(url, timeout=30)
     response.raise_for_status()
-    data = response.json()
+    data = parse_json(response.content)
     
     events = data.get('events', [])
     games = []
@@ -182,31 +187,30 @@ def parse_espn_event(event: dict, season_value: int) -> dict:
 
 
 def get_existing_games(season_value: int) -> dict:
-    """Get all games already in DynamoDB for this season"""
+    """
+    Get all games already in DynamoDB for this season (change-detection
+    fields only). Safe to run off the main thread.
+    """
+    table = get_thread_table(DYNAMODB_TABLE)
     existing = {}
+    query_kwargs = {
+        'KeyConditionExpression': 'pk = :pk',
+        'ExpressionAttributeValues': {':pk': f"SEASON#{season_value}"},
+        'ProjectionExpression': EXISTING_PROJECTION,
+        'ExpressionAttributeNames': {'#s': 'status'},
+    }
     
     try:
-        response = table.query(
-            KeyConditionExpression='PK = :pk',
-            ExpressionAttributeValues={':pk': f"SEASON#{season_value}"}
-        )
-        
-        for item in response.get('Items', []):
-            game_id = item.get('game_id')
-            if game_id:
-                existing[game_id] = item
-        
-        # Handle pagination
-        while 'LastEvaluatedKey' in response:
-            response = table.query(
-                KeyConditionExpression='PK = :pk',
-                ExpressionAttributeValues={':pk': f"SEASON#{season_value}"},
-                ExclusiveStartKey=response['LastEvaluatedKey']
-            )
+        while True:
+            response = table.query(**query_kwargs)
             for item in response.get('Items', []):
                 game_id = item.get('game_id')
                 if game_id:
                     existing[game_id] = item
+            
+            if 'LastEvaluatedKey' not in response:
+                break
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
                     
     except ClientError as e:
         print(f"⚠️  Error querying DynamoDB: {e}")
@@ -214,35 +218,33 @@ def get_existing_games(season_value: int) -> dict:
     return existing
 
 
-def store_game(game: dict, season_value: int) -> bool:
-    """Store a single game in DynamoDB"""
-    try:
-        # Create sort key from date and game_id
-        date_part = game['date'].split('T')[0] if 'T' in game['date'] else game['date']
-        
-        item = {
-            'pk': f"SEASON#{season_value}",
-            'sk': f"GAME#{date_part}#{game['game_id']}",
-            'game_id': game['game_id'],
-            'date': game['date'],
-            'short_name': game['short_name'],
-            'season_type': game['season_type'],
-            'status': game['status'],
-            'status_completed': game['status_completed'],
-            'iowa_score': game['iowa_score'],
-            'iowa_won': game['iowa_won'],
-            'opponent_abbrev': game['opponent_abbrev'],
-            'opponent_score': game['opponent_score'],
-            'tournament_round': game.get('tournament_round'),
-            'updated_at': datetime.now().isoformat(),
-        }
-        
-        table.put_item(Item=item)
-        return True
-        
-    except ClientError as e:
-        print(f"⚠️  Error storing game {game['game_id']}: {e}")
-        return False
+def store_game(batch, game: dict, season_value: int):
+    """
+    Queue a single game's SEASON# entry on the sync's batch writer.
+    
+    Write errors surface when the batch flushes; sync_season handles them.
+    """
+    # Create sort key from date and game_id
+    date_part = game['date'].split('T')[0] if 'T' in game['date'] else game['date']
+    
+    item = {
+        'pk': f"SEASON#{season_value}",
+        'sk': f"GAME#{date_part}#{game['game_id']}",
+        'game_id': game['game_id'],
+        'date': game['date'],
+        'short_name': game['short_name'],
+        'season_type': game['season_type'],
+        'status': game['status'],
+        'status_completed': game['status_completed'],
+        'iowa_score': game['iowa_score'],
+        'iowa_won': game['iowa_won'],
+        'opponent_abbrev': game['opponent_abbrev'],
+        'opponent_score': game['opponent_score'],
+        'tournament_round': game.get('tournament_round'),
+        'updated_at': datetime.now().isoformat(),
+    }
+    
+    batch.put_item(Item=item)
 
 
 def games_are_different(new_game: dict, existing_game: dict) -> bool:
@@ -269,12 +271,13 @@ def sync_season(season_value: int, force: bool = False) -> dict:
     print(f"\n🏀 Syncing Iowa Hawkeyes {season_label} Season (value: {season_value})")
     print("=" * 60)
     
-    # Fetch from ESPN
-    espn_games = fetch_espn_schedule(season_value)
-    print(f"📊 Found {len(espn_games)} games on ESPN schedule")
+    # The ESPN fetch and the DynamoDB read are independent, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        existing_future = executor.submit(get_existing_games, season_value)
+        espn_games = fetch_espn_schedule(season_value)
+        existing_games = existing_future.result()
     
-    # Get existing games
-    existing_games = get_existing_games(season_value)
+    print(f"📊 Found {len(espn_games)} games on ESPN schedule")
     print(f"💾 Found {len(existing_games)} games already in database")
     
     # Track results
@@ -290,48 +293,55 @@ def sync_season(season_value: int, force: bool = False) -> dict:
     print("\n📝 Processing games...")
     print("-" * 60)
     
-    for game in espn_games:
-        game_id = game['game_id']
-        date_str = game['date'].split('T')[0] if 'T' in game['date'] else game['date']
-        opponent = game['opponent_abbrev']
-        status = "✅" if game['status_completed'] else "📅"
-        
-        if game_id in existing_games:
-            existing = existing_games[game_id]
-            
-            if force or games_are_different(game, existing):
-                # Game changed (e.g., completed), update it
-                if store_game(game, season_value):
-                    results['updated'] += 1
-                    results['games_updated'].append(game)
+    # All adds/updates go out as 25-item BatchWriteItem calls
+    try:
+        with table.batch_writer(overwrite_by_pkeys=['pk', 'sk']) as batch:
+            for game in espn_games:
+                game_id = game['game_id']
+                date_str = game['date'].split('T')[0] if 'T' in game['date'] else game['date']
+                opponent = game['opponent_abbrev']
+                status = "✅" if game['status_completed'] else "📅"
+                
+                if game_id in existing_games:
+                    existing = existing_games[game_id]
                     
-                    # Show what changed
-                    if not existing.get('status_completed') and game['status_completed']:
+                    if force or games_are_different(game, existing):
+                        # Game changed (e.g., completed), update it
+                        store_game(batch, game, season_value)
+                        results['updated'] += 1
+                        results['games_updated'].append(game)
+                        
+                        # Show what changed
+                        if not existing.get('status_completed') and game['status_completed']:
+                            score = f"{game['iowa_score']}-{game['opponent_score']}"
+                            result = "W" if game['iowa_won'] else "L"
+                            print(f"   🔄 UPDATED: {date_str} vs {opponent} → {result} {score}")
+                        else:
+                            print(f"   🔄 UPDATED: {date_str} vs {opponent}")
+                    else:
+                        # No changes, skip
+                        results['skipped'] += 1
+                        print(f"   ⏭️  SKIPPED: {date_str} vs {opponent} (no changes)")
+                else:
+                    # New game, add it
+                    store_game(batch, game, season_value)
+                    results['added'] += 1
+                    results['games_added'].append(game)
+                    
+                    if game['status_completed']:
                         score = f"{game['iowa_score']}-{game['opponent_score']}"
                         result = "W" if game['iowa_won'] else "L"
-                        print(f"   🔄 UPDATED: {date_str} vs {opponent} → {result} {score}")
+                        print(f"   ✨ ADDED:   {date_str} vs {opponent} → {result} {score}")
                     else:
-                        print(f"   🔄 UPDATED: {date_str} vs {opponent}")
-                else:
-                    results['errors'] += 1
-            else:
-                # No changes, skip
-                results['skipped'] += 1
-                print(f"   ⏭️  SKIPPED: {date_str} vs {opponent} (no changes)")
-        else:
-            # New game, add it
-            if store_game(game, season_value):
-                results['added'] += 1
-                results['games_added'].append(game)
-                
-                if game['status_completed']:
-                    score = f"{game['iowa_score']}-{game['opponent_score']}"
-                    result = "W" if game['iowa_won'] else "L"
-                    print(f"   ✨ ADDED:   {date_str} vs {opponent} → {result} {score}")
-                else:
-                    print(f"   ✨ ADDED:   {date_str} vs {opponent} (scheduled)")
-            else:
-                results['errors'] += 1
+                        print(f"   ✨ ADDED:   {date_str} vs {opponent} (scheduled)")
+    
+    except ClientError as e:
+        # Some queued writes may not have landed, so don't report any as stored
+        print(f"⚠️  Error storing games: {e}")
+        results['errors'] += results['added'] + results['updated']
+        results['added'] = results['updated'] = 0
+        results['games_added'] = []
+        results['games_updated'] = []
     
     return results
 